@@ -34,194 +34,540 @@ For detailed help on any command, use:
 
 import os
 import sys
+import math
 import argparse
+import functools
+import importlib.util
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
+from types import MappingProxyType, ModuleType
 
-# Add scripts directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+# Third-party modules (rich, dotenv, github) are imported where they are first
+# needed, so argparse's --help and the token check run with the stdlib only
+ENV_FILE = Path(__file__).parent / ".env"
+SCRIPTS_DIR = Path(__file__).parent / "scripts"
 
-try:
-    from dotenv import load_dotenv
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.text import Text
-    from rich.table import Table
-except ImportError as e:
+# Package the scripts/ modules are loaded under, so generic names such as
+# formatting or github_session stay out of the top level of sys.modules
+_SCRIPTS_PACKAGE = "_repo_tools_scripts"
+
+
+class _ScriptsFinder:
+    """Resolve the scripts' plain sibling imports to their packaged modules.
+    
+    The scripts import each other by plain name, since they also run
+    standalone from scripts/. The finder only answers for files that exist
+    in scripts/ and is consulted last, so installed packages keep priority.
+    The plain-name entries the import system records are dropped by _load.
+    """
+    
+    def __init__(self):
+        self.aliases = set()
+    
+    def find_spec(self, fullname, path=None, target=None):
+        if path is not None or not (SCRIPTS_DIR / f"{fullname}.py").is_file():
+            return None
+        return importlib.util.spec_from_loader(fullname, self)
+    
+    def create_module(self, spec):
+        self.aliases.add(spec.name)
+        return importlib.import_module(f"{_SCRIPTS_PACKAGE}.{spec.name}")
+    
+    def exec_module(self, module):
+        """Nothing to run; the packaged module executed when it was imported."""
+
+
+_SCRIPTS_FINDER = _ScriptsFinder()
+
+
+def _listing_pages(count: int) -> int:
+    """Number of listing requests needed for count repositories."""
+    # An empty listing still takes one request
+    return max(1, math.ceil(count / REPOS_PER_PAGE))
+
+
+def _missing_dependency(e: ImportError) -> None:
+    """Report a missing third-party package and exit."""
     print(f"Missing required dependency: {e}")
     print("Install with: pip install -r requirements.txt")
     sys.exit(1)
 
 
+@functools.lru_cache(maxsize=None)
+def _load(name: str):
+    """Import a module from scripts/ under the private package, once per process."""
+    if _SCRIPTS_PACKAGE not in sys.modules:
+        package = ModuleType(_SCRIPTS_PACKAGE)
+        package.__path__ = [str(SCRIPTS_DIR)]
+        sys.modules[_SCRIPTS_PACKAGE] = package
+        sys.meta_path.append(_SCRIPTS_FINDER)
+    
+    try:
+        return importlib.import_module(f"{_SCRIPTS_PACKAGE}.{name}")
+    finally:
+        # Later plain imports resolve through the finder to the same modules
+        while _SCRIPTS_FINDER.aliases:
+            sys.modules.pop(_SCRIPTS_FINDER.aliases.pop(), None)
+
+
+# Remaining core API calls below which commands warn before starting
+LOW_RATE_LIMIT = 20
+# Repositories per listing request, REST and GraphQL alike
+REPOS_PER_PAGE = 100
+# Exit status when the API quota cannot cover a run (without --force)
+EXIT_RATE_LIMITED = 2
+
+
+# Static help content; read-only so the cached renderings below stay valid
+_HELP_INFO = MappingProxyType({
+    "list": {
+        "description": "Display a formatted table of your GitHub repositories",
+        "usage": "python main.py list [options]",
+        "options": [
+            ("--compact", "Use compact table format (auto-enabled for >20 repos)"),
+            ("--limit N", "Limit to N repositories (default: all)"),
+            ("--force", "Run even if the API quota looks too low"),
+        ],
+        "examples": [
+            "python main.py list",
+            "python main.py list --compact",
+            "python main.py list --limit 10",
+        ]
+    },
+    "privacy": {
+        "description": "Manage repository privacy and clean up zero-star repos/forks",
+        "usage": "python main.py privacy [options]",
+        "options": [
+            ("--dry-run", "Preview changes without making them (default)"),
+            ("--execute", "Actually perform the privacy changes"),
+            ("--force", "Run even if the API quota looks too low"),
+        ],
+        "examples": [
+            "python main.py privacy",
+            "python main.py privacy --dry-run",
+            "python main.py privacy --execute",
+        ]
+    },
+    "backup": {
+        "description": "Clone and backup all repositories to local directory",
+        "usage": "python main.py backup [options]",
+        "options": [
+            ("--backup-path PATH", "Custom backup directory (default: ~/Developer/Github/Backup)"),
+            ("--dry-run", "Preview what would be backed up without cloning"),
+            ("--jobs N", "Clone/update N repositories concurrently (default: 2x CPUs, max 8)"),
+            ("--working-tree", "Clone full checkouts instead of bare mirrors"),
+            ("--depth N", "Shallow-clone new repositories with the latest N commits"),
+            ("--blobless", "With --working-tree, fetch old file contents only on demand"),
+            ("--force-update", "Update repositories unchanged since the last backup too"),
+            ("--include-archived", "Also update archived repositories already backed up"),
+            ("--verbose", "Also report the remaining API rate limit"),
+            ("--no-cache", "Bypass the on-disk HTTP cache"),
+            ("--force", "Run even if the API quota looks too low"),
+        ],
+        "examples": [
+            "python main.py backup",
+            "python main.py backup --dry-run",
+            "python main.py backup --backup-path /custom/path",
+            "python main.py backup --jobs 16",
+        ]
+    },
+    "create": {
+        "description": "Create a new GitHub repository with custom settings",
+        "usage": "python main.py create [options]",
+        "options": [
+            ("--name NAME", "Repository name (interactive prompt if not provided)"),
+            ("--description DESC", "Repository description"),
+            ("--private", "Make repository private"),
+            ("--auto-init", "Initialize with README"),
+            ("--no-issues", "Disable issues"),
+            ("--enable-wiki", "Enable wiki"),
+            ("--enable-projects", "Enable projects"),
+            ("--setup-remote", "Set up git remote after creation"),
+            ("--yes, -y", "Answer yes to every confirmation; never prompt"),
+        ],
+        "examples": [
+            "python main.py create",
+            "python main.py create --name 'MyProject' --description 'My awesome project'",
+            "python main.py create --name 'PrivateRepo' --private",
+            "python main.py create --name 'NewProject' --auto-init --enable-wiki",
+            "python main.py create --name 'CIRepo' --private --setup-remote --yes",
+        ]
+    }
+})
+
+# (command, description, example) rows of the welcome screen
+_WELCOME_COMMANDS = (
+    ("list", "List all repositories with details", "main.py list --compact"),
+    ("privacy", "Manage repository privacy settings", "main.py privacy --dry-run"),
+    ("backup", "Backup repositories to local directory", "main.py backup --dry-run"),
+    ("create", "Create a new GitHub repository", "main.py create --name 'MyRepo'"),
+    ("help", "Show detailed help for a command", "main.py help backup"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _welcome_screen():
+    """Build the welcome screen's commands panel and hint once per process."""
+    try:
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich.text import Text
+    except ImportError as e:
+        _missing_dependency(e)
+    
+    commands_table = Table(show_header=True, header_style="bold cyan")
+    commands_table.add_column("Command", style="green", width=12)
+    commands_table.add_column("Description", style="white")
+    commands_table.add_column("Example", style="dim")
+    
+    for row in _WELCOME_COMMANDS:
+        commands_table.add_row(*row)
+    
+    panel = Panel(
+        commands_table,
+        title="📚 Available Commands",
+        border_style="blue",
+        padding=(1, 2)
+    )
+    hint = Text.from_markup("\\n[dim]Use 'python main.py <command> --help' for detailed options.[/dim]")
+    return Group(panel, hint)
+
+
+# Header of each help page, rendered with format_map
+_HELP_HEADER_TEMPLATE = (
+    "[bold blue]{title} Command Help[/bold blue]\n\n"
+    "[bold]Description:[/bold] {description}\n\n"
+    "[bold]Usage:[/bold] {usage}\n"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _command_help_text(command: str) -> str:
+    """Render the markup for one command's help page, cached per command."""
+    info = _HELP_INFO[command]
+    lines = [_HELP_HEADER_TEMPLATE.format_map({'title': command.upper(), **info})]
+    
+    if info['options']:
+        lines.append("[bold]Options:[/bold]")
+        lines.extend(f"  [cyan]{option:<20}[/cyan] {desc}" for option, desc in info['options'])
+        lines.append("")
+    
+    if info['examples']:
+        lines.append("[bold]Examples:[/bold]")
+        lines.extend(f"  [dim]{example}[/dim]" for example in info['examples'])
+    
+    return "\n".join(lines)
+
+
+def _build_list_parser(subparsers):
+    """Register the list command's arguments."""
+    list_parser = subparsers.add_parser('list', help='List all repositories')
+    list_parser.add_argument('--compact', action='store_true', help='Use compact table format')
+    list_parser.add_argument('--limit', type=int, default=None, help='Limit number of repositories shown')
+    list_parser.add_argument('--force', action='store_true', help='Run even if the API quota looks too low')
+
+
+def _build_privacy_parser(subparsers):
+    """Register the privacy command's arguments."""
+    privacy_parser = subparsers.add_parser('privacy', help='Manage repository privacy')
+    privacy_parser.add_argument('--execute', action='store_true', help='Execute changes (default is dry-run)')
+    privacy_parser.add_argument('--force', action='store_true', help='Run even if the API quota looks too low')
+
+
+def _build_backup_parser(subparsers):
+    """Register the backup command's arguments."""
+    backup_parser = subparsers.add_parser('backup', help='Backup repositories')
+    backup_parser.add_argument('--backup-path', default=None, help='Custom backup directory path')
+    backup_parser.add_argument('--dry-run', action='store_true', help='Preview without actually backing up')
+    backup_parser.add_argument('--working-tree', action='store_true', help='Clone full checkouts instead of bare mirrors')
+    backup_parser.add_argument('--depth', type=int, default=None, help='Shallow-clone new repositories with the latest N commits')
+    backup_parser.add_argument('--blobless', action='store_true', help='With --working-tree, partial-clone new checkouts and fetch old file contents from GitHub on demand')
+    backup_parser.add_argument('--force-update', action='store_true', help='Update repositories unchanged since the last backup')
+    backup_parser.add_argument('--include-archived', action='store_true', help='Also update archived repositories already backed up')
+    backup_parser.add_argument('--verbose', action='store_true', help='Also report the remaining API rate limit')
+    backup_parser.add_argument('--no-cache', action='store_true', help='Bypass the on-disk HTTP cache')
+    backup_parser.add_argument('--force', action='store_true', help='Run even if the API quota looks too low')
+    backup_parser.add_argument('--jobs', type=int, default=None, help='Number of concurrent clone/update workers (default: 2x CPUs, max 8)')
+
+
+def _build_create_parser(subparsers):
+    """Register the create command's arguments."""
+    create_parser = subparsers.add_parser('create', help='Create a new repository')
+    create_parser.add_argument('--name', default=None, help='Repository name')
+    create_parser.add_argument('--description', help='Repository description', default="")
+    create_parser.add_argument('--private', action='store_true', help='Make repository private')
+    create_parser.add_argument('--auto-init', action='store_true', help='Initialize with README')
+    create_parser.add_argument('--no-issues', action='store_true', help='Disable issues')
+    create_parser.add_argument('--enable-wiki', action='store_true', help='Enable wiki')
+    create_parser.add_argument('--enable-projects', action='store_true', help='Enable projects')
+    create_parser.add_argument('--setup-remote', action='store_true', help='Set up git remote after creation')
+    create_parser.add_argument('--yes', '-y', action='store_true', help='Answer yes to every confirmation (non-interactive)')
+
+
+def _build_help_parser(subparsers):
+    """Register the help command's arguments."""
+    help_parser = subparsers.add_parser('help', help='Show detailed help for a command')
+    help_parser.add_argument('topic', nargs='?', default=None, help='Command to get help for')
+
+
+# Subcommand -> (check, error) pairs of flag combinations that are rejected
+# before any network call; a check returns True for invalid arguments
+_VALIDATORS = MappingProxyType({
+    "list": (
+        (lambda a: a.limit is not None and a.limit < 1, "--limit must be at least 1"),
+    ),
+    "backup": (
+        (lambda a: a.jobs is not None and a.jobs < 1, "--jobs must be at least 1"),
+        (lambda a: a.depth is not None and a.depth < 1, "--depth must be at least 1"),
+        # A blobless mirror holds no file contents at all, not even the latest
+        (lambda a: a.blobless and not a.working_tree, "--blobless requires --working-tree"),
+    ),
+    "create": (
+        (lambda a: a.yes and not a.name, "--name is required with --yes"),
+    ),
+})
+
+
+def _validate(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Reject invalid flag combinations via the subcommand's parser (exit status 2)."""
+    for is_invalid, message in _VALIDATORS.get(args.command, ()):
+        if is_invalid(args):
+            parser.error(message)
+
+
+class _CommandOpts:
+    """Base for the per-command option records bound from parsed arguments."""
+    __slots__ = ()
+    
+    @classmethod
+    def from_args(cls, args: argparse.Namespace):
+        """Bind the parsed arguments once, falling back to field defaults."""
+        return cls(**{f.name: getattr(args, f.name, f.default) for f in fields(cls)})
+
+
+@dataclass(slots=True, frozen=True)
+class ListOpts(_CommandOpts):
+    """Options of the list command."""
+    compact: bool = False
+    limit: Optional[int] = None
+    force: bool = False
+
+
+@dataclass(slots=True, frozen=True)
+class PrivacyOpts(_CommandOpts):
+    """Options of the privacy command."""
+    execute: bool = False
+    force: bool = False
+
+
+@dataclass(slots=True, frozen=True)
+class BackupOpts(_CommandOpts):
+    """Options of the backup command."""
+    backup_path: Optional[str] = None
+    dry_run: bool = False
+    jobs: Optional[int] = None
+    working_tree: bool = False
+    depth: Optional[int] = None
+    blobless: bool = False
+    force_update: bool = False
+    include_archived: bool = False
+    verbose: bool = False
+    no_cache: bool = False
+    force: bool = False
+
+
+@dataclass(slots=True, frozen=True)
+class CreateOpts(_CommandOpts):
+    """Options of the create command."""
+    name: Optional[str] = None
+    description: str = ""
+    private: bool = False
+    auto_init: bool = False
+    no_issues: bool = False
+    enable_wiki: bool = False
+    enable_projects: bool = False
+    setup_remote: bool = False
+    yes: bool = False
+
+
+# Subcommand name -> parser builder, in the order shown by --help
+PARSER_BUILDERS = {
+    "list": _build_list_parser,
+    "privacy": _build_privacy_parser,
+    "backup": _build_backup_parser,
+    "create": _build_create_parser,
+    "help": _build_help_parser,
+}
+
+
 class GitHubCLI:
     """Main CLI class for GitHub repository management."""
     
     def __init__(self):
-        self.console = Console()
-        load_dotenv()
+        self._console = None
+        # An exported token wins anyway, so skip importing dotenv entirely
+        if not os.environ.get("GITHUB_TOKEN") and ENV_FILE.exists():
+            try:
+                from dotenv import load_dotenv
+            except ImportError as e:
+                _missing_dependency(e)
+            load_dotenv(dotenv_path=ENV_FILE, override=False)
+        self._github = None
+        # Login of the authenticated account, once known
+        self._owner = None
+        # Core rate-limit bucket, read once by check_token
+        self._rate_core = None
+        self._rate_graphql = None
+    
+    @property
+    def console(self):
+        """Rich console, created on first output."""
+        if self._console is None:
+            try:
+                from rich.console import Console
+            except ImportError as e:
+                _missing_dependency(e)
+            self._console = Console()
+        return self._console
+    
+    @property
+    def github(self):
+        """GitHub client shared by every command, so they reuse one connection pool."""
+        if self._github is None:
+            try:
+                from github import Auth, Github
+            except ImportError as e:
+                _missing_dependency(e)
+            _load("github_session").install_orjson_decoder()
+            self._github = Github(
+                auth=Auth.Token(os.getenv('GITHUB_TOKEN')),
+                per_page=100,
+                pool_size=20
+            )
+        return self._github
         
     def check_token(self) -> bool:
         """Check if GitHub token is available."""
         token = os.getenv('GITHUB_TOKEN')
         if not token:
-            self.console.print("[bold red]✗ GITHUB_TOKEN environment variable not set[/bold red]")
-            self.console.print("\nPlease set your GitHub Personal Access Token:")
-            self.console.print("1. Go to https://github.com/settings/tokens")
-            self.console.print("2. Generate a new token with 'repo' scope")
-            self.console.print("3. Set the token: export GITHUB_TOKEN='your_token_here'")
-            self.console.print("\nOr add it to your .env file:")
-            self.console.print("echo 'GITHUB_TOKEN=your_token_here' >> .env")
+            # Plain print keeps rich unloaded on this early-exit path
+            print("✗ GITHUB_TOKEN environment variable not set")
+            print("\nPlease set your GitHub Personal Access Token:")
+            print("1. Go to https://github.com/settings/tokens")
+            print("2. Generate a new token with 'repo' scope")
+            print("3. Set the token: export GITHUB_TOKEN='your_token_here'")
+            print("\nOr add it to your .env file:")
+            print("echo 'GITHUB_TOKEN=your_token_here' >> .env")
+            return False
+        
+        # /rate_limit is the cheapest authenticated endpoint and does not count
+        # against the quota; it both validates the token and reports the budget
+        try:
+            rate_limit = self.github.get_rate_limit()
+            self._rate_core = rate_limit.core
+            self._rate_graphql = rate_limit.graphql
+        except Exception as e:
+            self.console.print(f"[bold red]✗ Could not validate GITHUB_TOKEN:[/bold red] {str(e)}")
             return False
         return True
     
-    def show_welcome(self):
-        """Display welcome message and available commands."""
-        title = Text("GitHub Repository Management CLI", style="bold blue")
+    @functools.lru_cache(maxsize=1)
+    def _authenticated_user(self):
+        """Return the authenticated user, fetched once per process."""
+        user = self.github.get_user()
+        self._owner = user.login
+        return user
+    
+    def validate_user(self, verbose: bool = False) -> bool:
+        """Report the authenticated account and warn when the API quota is low.
         
-        commands_table = Table(show_header=True, header_style="bold cyan")
-        commands_table.add_column("Command", style="green", width=12)
-        commands_table.add_column("Description", style="white")
-        commands_table.add_column("Example", style="dim")
+        With verbose, the remaining quota fetched by check_token is reported
+        as well.
+        """
+        try:
+            user = self._authenticated_user()
+        except Exception as e:
+            self.console.print(f"[red]Authentication failed: {e}[/red]")
+            return False
         
-        commands_table.add_row(
-            "list", 
-            "List all repositories with details", 
-            "main.py list --compact"
-        )
-        commands_table.add_row(
-            "privacy", 
-            "Manage repository privacy settings", 
-            "main.py privacy --dry-run"
-        )
-        commands_table.add_row(
-            "backup", 
-            "Backup repositories to local directory", 
-            "main.py backup --dry-run"
-        )
-        commands_table.add_row(
-            "create", 
-            "Create a new GitHub repository", 
-            "main.py create --name 'MyRepo'"
-        )
-        commands_table.add_row(
-            "help", 
-            "Show detailed help for a command", 
-            "main.py help backup"
-        )
+        self.console.print(f"[green]Authenticated as: {user.login}[/green]")
+        if verbose and self._rate_core:
+            self.console.print(
+                f"✓ Rate limit: {self._rate_core.remaining}/{self._rate_core.limit} "
+                f"(resets at {self._rate_core.reset})"
+            )
+        if self._rate_core and self._rate_core.remaining < LOW_RATE_LIMIT:
+            self.console.print(
+                f"[yellow]Warning: Only {self._rate_core.remaining} API calls remaining. "
+                f"Resets at {self._rate_core.reset}[/yellow]"
+            )
+        return True
+    
+    def _repository_count(self) -> int:
+        """Number of repositories the account owns, from the cached /user data.
         
-        panel_content = f"{title}\\n\\n{commands_table}"
-        panel = Panel(
-            commands_table,
-            title="📚 Available Commands",
-            border_style="blue",
-            padding=(1, 2)
-        )
+        The listings also include collaborator and organization repositories,
+        so estimates built on this are lower bounds.
+        """
+        user = self._authenticated_user()
+        return user.public_repos + (user.total_private_repos or 0)
+    
+    def ensure_rate_budget(self, core: int = 0, graphql: int = 0, force: bool = False,
+                           owned_only: bool = True) -> None:
+        """Exit before starting work the remaining API quota cannot cover.
         
-        self.console.print(panel)
-        self.console.print("\\n[dim]Use 'python main.py <command> --help' for detailed options.[/dim]")
+        Uses the limits fetched by check_token, so it costs no requests.
+        owned_only marks estimates built on _repository_count, which the
+        message then states as a lower bound.
+        """
+        basis = " (counting only repositories you own)" if owned_only else ""
+        for api, needed, rate in (("REST", core, self._rate_core), ("GraphQL", graphql, self._rate_graphql)):
+            if rate is None or needed <= rate.remaining:
+                continue
+            
+            minutes = max(0, math.ceil((rate.reset - datetime.now(timezone.utc)).total_seconds() / 60))
+            self.console.print(
+                f"[bold red]✗ This run needs at least {needed} {api} API calls{basis} but only "
+                f"{rate.remaining} remain; the quota resets in {minutes} min ({rate.reset}).[/bold red]"
+            )
+            if not force:
+                self.console.print("Use --force to run anyway.")
+                sys.exit(EXIT_RATE_LIMITED)
+            self.console.print("[yellow]Continuing because of --force[/yellow]")
+    
+    def show_welcome(self):
+        """Display welcome message and available commands."""
+        self.console.print(_welcome_screen())
     
     def show_command_help(self, command: str):
         """Show detailed help for a specific command."""
-        help_info = {
-            "list": {
-                "description": "Display a formatted table of your GitHub repositories",
-                "usage": "python main.py list [options]",
-                "options": [
-                    ("--compact", "Use compact table format (auto-enabled for >20 repos)"),
-                    ("--limit N", "Limit to N repositories (default: all)"),
-                ],
-                "examples": [
-                    "python main.py list",
-                    "python main.py list --compact",
-                    "python main.py list --limit 10",
-                ]
-            },
-            "privacy": {
-                "description": "Manage repository privacy and clean up zero-star repos/forks",
-                "usage": "python main.py privacy [options]",
-                "options": [
-                    ("--dry-run", "Preview changes without making them (default)"),
-                    ("--execute", "Actually perform the privacy changes"),
-                ],
-                "examples": [
-                    "python main.py privacy",
-                    "python main.py privacy --dry-run",
-                    "python main.py privacy --execute",
-                ]
-            },
-            "backup": {
-                "description": "Clone and backup all repositories to local directory",
-                "usage": "python main.py backup [options]",
-                "options": [
-                    ("--backup-path PATH", "Custom backup directory (default: ~/Developer/Github/Backup)"),
-                    ("--dry-run", "Preview what would be backed up without cloning"),
-                ],
-                "examples": [
-                    "python main.py backup",
-                    "python main.py backup --dry-run",
-                    "python main.py backup --backup-path /custom/path",
-                ]
-            },
-            "create": {
-                "description": "Create a new GitHub repository with custom settings",
-                "usage": "python main.py create [options]",
-                "options": [
-                    ("--name NAME", "Repository name (interactive prompt if not provided)"),
-                    ("--description DESC", "Repository description"),
-                    ("--private", "Make repository private"),
-                    ("--auto-init", "Initialize with README"),
-                    ("--no-issues", "Disable issues"),
-                    ("--enable-wiki", "Enable wiki"),
-                    ("--enable-projects", "Enable projects"),
-                    ("--setup-remote", "Set up git remote after creation"),
-                ],
-                "examples": [
-                    "python main.py create",
-                    "python main.py create --name 'MyProject' --description 'My awesome project'",
-                    "python main.py create --name 'PrivateRepo' --private",
-                    "python main.py create --name 'NewProject' --auto-init --enable-wiki",
-                ]
-            }
-        }
-        
-        if command not in help_info:
+        if command not in _HELP_INFO:
             self.console.print(f"[red]Unknown command: {command}[/red]")
             self.console.print("Available commands: list, privacy, backup, create")
             return
         
-        info = help_info[command]
-        
-        # Create help display
-        self.console.print(f"[bold blue]{command.upper()} Command Help[/bold blue]\\n")
-        self.console.print(f"[bold]Description:[/bold] {info['description']}\\n")
-        self.console.print(f"[bold]Usage:[/bold] {info['usage']}\\n")
-        
-        if info['options']:
-            self.console.print("[bold]Options:[/bold]")
-            for option, desc in info['options']:
-                self.console.print(f"  [cyan]{option:<20}[/cyan] {desc}")
-            self.console.print()
-        
-        if info['examples']:
-            self.console.print("[bold]Examples:[/bold]")
-            for example in info['examples']:
-                self.console.print(f"  [dim]{example}[/dim]")
+        self.console.print(_command_help_text(command))
     
     def run_list_command(self, args):
         """Execute the list repositories command."""
         try:
-            from list_repos import GitHubRepoLister
+            GitHubRepoLister = _load("list_repos").GitHubRepoLister
             
             token = os.getenv('GITHUB_TOKEN')
-            lister = GitHubRepoLister(token)
+            lister = GitHubRepoLister(token, github=self.github)
             
-            if not lister.validate_token():
+            if not self.validate_user():
                 sys.exit(1)
             
-            # Parse arguments
-            compact = getattr(args, 'compact', False)
-            limit = getattr(args, 'limit', None)
-            
-            lister.display_repositories(limit=limit, compact=compact)
+            opts = ListOpts.from_args(args)
+            count = self._repository_count()
+            if opts.limit:
+                count = min(count, opts.limit)
+            self.ensure_rate_budget(graphql=_listing_pages(count), force=opts.force)
+            lister.display_repositories(limit=opts.limit, compact=opts.compact)
             
         except ImportError as e:
             self.console.print(f"[red]Error importing list_repos module: {e}[/red]")
@@ -230,22 +576,32 @@ class GitHubCLI:
     def run_privacy_command(self, args):
         """Execute the privacy management command."""
         try:
-            from set_repos_private import GitHubPrivacyManager
+            GitHubPrivacyManager = _load("set_repos_private").GitHubPrivacyManager
             
             token = os.getenv('GITHUB_TOKEN')
-            manager = GitHubPrivacyManager(token)
             
-            if not manager.validate_token():
+            if not self.validate_user():
                 sys.exit(1)
             
+            manager = GitHubPrivacyManager(token, github=self.github, owner=self._owner)
+            
             # Default to dry-run unless --execute is specified
-            dry_run = not getattr(args, 'execute', False)
+            opts = PrivacyOpts.from_args(args)
+            dry_run = not opts.execute
+            
+            # Finding the candidates takes at most a full listing
+            self.ensure_rate_budget(graphql=_listing_pages(self._repository_count()), force=opts.force)
             
             if dry_run:
                 self.console.print("[bold blue]Running in DRY-RUN mode (no changes will be made)[/bold blue]")
                 self.console.print("Use --execute to actually perform changes\\n")
+                manager.run(dry_run=True)
+                return
             
-            manager.run(dry_run=dry_run)
+            # Each candidate is fetched and then edited or deleted
+            repos, forks = manager.find_zero_star_public_repos()
+            self.ensure_rate_budget(core=2 * (len(repos) + len(forks)), force=opts.force, owned_only=False)
+            manager.run(dry_run=False, candidates=(repos, forks))
             
         except ImportError as e:
             self.console.print(f"[red]Error importing set_repos_private module: {e}[/red]")
@@ -254,25 +610,44 @@ class GitHubCLI:
     def run_backup_command(self, args):
         """Execute the backup repositories command."""
         try:
-            from backup_repos import GitHubRepoBackup
+            GitHubRepoBackup = _load("backup_repos").GitHubRepoBackup
             
             token = os.getenv('GITHUB_TOKEN')
-            backup_path = getattr(args, 'backup_path', None) or os.getenv('BACKUP_PATH')
-            dry_run = getattr(args, 'dry_run', False)
+            opts = BackupOpts.from_args(args)
+            dry_run = opts.dry_run
             
-            backup_manager = GitHubRepoBackup(token, backup_path)
+            backup_manager = GitHubRepoBackup(
+                token, opts.backup_path or os.getenv('BACKUP_PATH'),
+                working_tree=opts.working_tree,
+                depth=opts.depth,
+                blobless=opts.blobless,
+                verbose=opts.verbose,
+                github=self.github,
+                use_cache=not opts.no_cache
+            )
             
-            if not backup_manager.validate_token():
+            if not self.validate_user(verbose=opts.verbose):
                 sys.exit(1)
             
             if not backup_manager.setup_backup_directories():
                 sys.exit(1)
             
+            self.ensure_rate_budget(core=_listing_pages(self._repository_count()), force=opts.force)
+            
             # Get all repositories
             repos = backup_manager.get_all_repositories()
             if not repos:
                 sys.exit(1)
             
+            # Git traffic is not metered; only the parent lookup of a fork
+            # that is cloned for the first time is
+            if not dry_run:
+                new_forks = sum(
+                    1 for r in repos
+                    if r.fork and not backup_manager.is_backed_up(backup_manager.get_repository_path(r))
+                )
+                self.ensure_rate_budget(core=new_forks, force=opts.force, owned_only=False)
+            
             # Display backup summary
             backup_manager.display_backup_summary(repos)
             
@@ -284,7 +659,11 @@ class GitHubCLI:
                     sys.exit(0)
             
             # Perform backup
-            backup_manager.backup_repositories(repos, dry_run)
+            backup_manager.backup_repositories(
+                repos, dry_run, opts.jobs,
+                force_update=opts.force_update,
+                include_archived=opts.include_archived
+            )
             
         except ImportError as e:
             self.console.print(f"[red]Error importing backup_repos module: {e}[/red]")
@@ -293,63 +672,70 @@ class GitHubCLI:
     def run_create_command(self, args):
         """Execute the create repository command."""
         try:
-            from create_github_repo import create_github_repository, setup_git_remote
+            github_ops = _load("github_ops")
+            create_github_repository = github_ops.create_github_repository
+            setup_git_remote = github_ops.setup_git_remote
+            CREATE_NEXT_STEPS = github_ops.CREATE_NEXT_STEPS
+            SETTINGS_TEMPLATE = github_ops.SETTINGS_TEMPLATE
             from rich.prompt import Confirm, Prompt
             
             token = os.getenv('GITHUB_TOKEN')
             
-            # Get repository details
-            repo_name = getattr(args, 'name', None)
+            opts = CreateOpts.from_args(args)
+            
+            # Get repository details (--yes implies --name, see _VALIDATORS)
+            repo_name = opts.name
             if not repo_name:
                 repo_name = Prompt.ask("Repository name")
                 if not repo_name:
                     self.console.print("[bold red]Repository name is required[/bold red]")
                     sys.exit(1)
             
-            description = getattr(args, 'description', "")
-            if not description and not getattr(args, 'name', None):
+            description = opts.description
+            if not description and not opts.name:
                 description = Prompt.ask("Repository description (optional)", default="")
             
-            private = getattr(args, 'private', False)
-            if not getattr(args, 'private', False) and not getattr(args, 'name', None):
+            private = opts.private
+            if not private and not opts.name:
                 private = Confirm.ask("Make repository private?", default=False)
             
-            has_issues = not getattr(args, 'no_issues', False)
-            has_wiki = getattr(args, 'enable_wiki', False)
-            has_projects = getattr(args, 'enable_projects', False)
-            auto_init = getattr(args, 'auto_init', False)
-            setup_remote = getattr(args, 'setup_remote', False)
-            
-            # Display settings summary
-            self.console.print(f"\\n[bold]Repository Settings:[/bold]")
-            self.console.print(f"Name: {repo_name}")
-            self.console.print(f"Description: {description or 'No description'}")
-            self.console.print(f"Private: {private}")
-            self.console.print(f"Initialize with README: {auto_init}")
-            self.console.print(f"Issues: {has_issues}")
-            self.console.print(f"Wiki: {has_wiki}")
-            self.console.print(f"Projects: {has_projects}")
-            
-            if not Confirm.ask("\\nProceed with repository creation?", default=True):
+            has_issues = not opts.no_issues
+            has_wiki = opts.enable_wiki
+            has_projects = opts.enable_projects
+            auto_init = opts.auto_init
+            setup_remote = opts.setup_remote
+            
+            # Display settings summary from the shared template in a single call
+            self.console.print(SETTINGS_TEMPLATE.format_map({
+                'name': repo_name,
+                'description': description or 'No description',
+                'private': private,
+                'auto_init': auto_init,
+                'has_issues': has_issues,
+                'has_wiki': has_wiki,
+                'has_projects': has_projects
+            }))
+            
+            if not opts.yes and not Confirm.ask("\\nProceed with repository creation?", default=True):
                 self.console.print("Repository creation cancelled.")
                 sys.exit(0)
             
             # Create the repository
             if create_github_repository(
                 token, repo_name, description, private,
-                has_issues, has_wiki, has_projects, auto_init
+                has_issues, has_wiki, has_projects, auto_init,
+                gh=self.github
             ):
                 self.console.print("\\n[bold green]Repository created successfully![/bold green]")
                 
                 # Set up git remote if requested or auto-detected
-                if setup_remote or (not auto_init and Confirm.ask("Set up git remote for this project?", default=True)):
-                    if setup_git_remote(repo_name):
+                if setup_remote or (not auto_init and (
+                    opts.yes or Confirm.ask("Set up git remote for this project?", default=True)
+                )):
+                    if setup_git_remote(repo_name, assume_yes=opts.yes):
                         self.console.print("\\n[bold green]Git remote configured![/bold green]")
                         if not auto_init:
-                            self.console.print("\\nNext steps:")
-                            self.console.print("1. git add .")
-                            self.console.print("2. git commit -m 'Initial commit'")
-                            self.console.print("3. git push -u origin main")
+                            self.console.print("\n" + "\n".join(CREATE_NEXT_STEPS))
                     else:
                         self.console.print("\\n[bold yellow]Repository created but git remote setup failed[/bold yellow]")
             else:
@@ -357,7 +743,7 @@ class GitHubCLI:
                 sys.exit(1)
                 
         except ImportError as e:
-            self.console.print(f"[red]Error importing create_github_repo module: {e}[/red]")
+            self.console.print(f"[red]Error importing github_ops module: {e}[/red]")
             sys.exit(1)
     
     def run(self):
@@ -379,34 +765,14 @@ For detailed help: python main.py help <command>
         
         subparsers = parser.add_subparsers(dest='command', help='Available commands')
         
-        # List command
-        list_parser = subparsers.add_parser('list', help='List all repositories')
-        list_parser.add_argument('--compact', action='store_true', help='Use compact table format')
-        list_parser.add_argument('--limit', type=int, help='Limit number of repositories shown')
-        
-        # Privacy command  
-        privacy_parser = subparsers.add_parser('privacy', help='Manage repository privacy')
-        privacy_parser.add_argument('--execute', action='store_true', help='Execute changes (default is dry-run)')
-        
-        # Backup command
-        backup_parser = subparsers.add_parser('backup', help='Backup repositories')
-        backup_parser.add_argument('--backup-path', help='Custom backup directory path')
-        backup_parser.add_argument('--dry-run', action='store_true', help='Preview without actually backing up')
-        
-        # Create command
-        create_parser = subparsers.add_parser('create', help='Create a new repository')
-        create_parser.add_argument('--name', help='Repository name')
-        create_parser.add_argument('--description', help='Repository description', default="")
-        create_parser.add_argument('--private', action='store_true', help='Make repository private')
-        create_parser.add_argument('--auto-init', action='store_true', help='Initialize with README')
-        create_parser.add_argument('--no-issues', action='store_true', help='Disable issues')
-        create_parser.add_argument('--enable-wiki', action='store_true', help='Enable wiki')
-        create_parser.add_argument('--enable-projects', action='store_true', help='Enable projects')
-        create_parser.add_argument('--setup-remote', action='store_true', help='Set up git remote after creation')
-        
-        # Help command
-        help_parser = subparsers.add_parser('help', help='Show detailed help for a command')
-        help_parser.add_argument('topic', nargs='?', help='Command to get help for')
+        # Only the invoked command's parser is built; --help, a bare
+        # invocation and unknown commands still get all of them
+        command = sys.argv[1] if len(sys.argv) > 1 else None
+        if command in PARSER_BUILDERS:
+            PARSER_BUILDERS[command](subparsers)
+        else:
+            for build_parser in PARSER_BUILDERS.values():
+                build_parser(subparsers)
         
         args = parser.parse_args()
         
@@ -423,6 +789,9 @@ For detailed help: python main.py help <command>
                 self.show_welcome()
             return
         
+        # Cheap local checks first, so invalid invocations fail before the network
+        _validate(subparsers.choices[args.command], args)
+        
         # Check for GitHub token before running commands
         if not self.check_token():
             sys.exit(1)
@@ -7,11 +7,26 @@ to a local backup directory. The script organizes repositories by type
 (public/private) and handles both regular repositories and forks.
 
 Usage:
-    python backup_repos.py [--backup-path /path/to/backup] [--dry-run]
+    python backup_repos.py [--backup-path /path/to/backup] [--dry-run] [--jobs N] [--working-tree]
+                           [--depth N] [--blobless] [--force-update] [--include-archived]
+                           [--verbose] [--no-cache]
 
 Arguments:
     --backup-path: Custom backup directory path (optional)
     --dry-run: Show what would be done without actually cloning
+    --jobs: Number of repositories to clone/update concurrently
+            (default: twice the CPU count, at most 8)
+    --working-tree: Clone full working-tree checkouts instead of bare mirrors
+    --depth: Shallow-clone new repositories with only the latest N commits
+    --blobless: With --working-tree, partial-clone new checkouts; old file
+                contents are fetched from GitHub on demand
+    --force-update: Update every repository, even those unchanged since the last run
+    --include-archived: Also update archived repositories that are already backed up
+    --verbose: Also report the remaining API rate limit
+    --no-cache: Do not use the on-disk HTTP cache for the repository listing
+
+Repositories are stored as bare mirror clones (<name>.git) by default, which
+keeps every ref and object without the cost of a checked-out working tree.
 
 Environment Variables:
     GITHUB_TOKEN: GitHub Personal Access Token with 'repo' scope (required)
@@ -29,42 +44,196 @@ Example:
 
 import os
 import sys
+import json
+import stat
+import atexit
+import shutil
 import argparse
+import tempfile
 import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 
 try:
+    import requests
     from github import Github, GithubException
     from rich.console import Console
     from rich.table import Table
     from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
     from rich.prompt import Confirm
     from rich.text import Text
-    from dotenv import load_dotenv
 except ImportError as e:
     print(f"Missing required dependency: {e}")
     print("Install with: pip install -r requirements.txt")
     sys.exit(1)
 
+from github_session import (
+    GITHUB_API_URL, create_session, decode_json, install_orjson_decoder, load_env, parse_timestamp
+)
+
+try:
+    # Optional: clones and fetches mirrors in-process instead of spawning git
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+if pygit2 is not None and hasattr(pygit2.settings, 'server_timeout'):
+    # Aborts socket reads that stall (in milliseconds); a stalled transfer
+    # never reaches the progress callback that enforces the overall deadline
+    pygit2.settings.server_timeout = UPDATE_TIMEOUT * 1000
+
+
+# Clones wait on the network, so oversubscribe the CPUs, but stay well
+# within the number of concurrent connections GitHub tolerates per user
+DEFAULT_JOBS = min(8, (os.cpu_count() or 1) * 2)
+REPOS_PER_PAGE = 100
+# Lines of git's stderr kept for error reporting
+STDERR_TAIL_LINES = 8
+# Seconds a clone or an update may take, through git or pygit2 alike
+CLONE_TIMEOUT = 300
+UPDATE_TIMEOUT = 60
+MANIFEST_NAME = ".backup_manifest.json"
+
+# Answers git's credential prompts from the environment so the token never
+# appears in a clone URL or in the process argument list
+ASKPASS_SCRIPT = """#!/bin/sh
+case "$1" in
+    Username*) echo x-access-token ;;
+    *) echo "$GITHUB_TOKEN" ;;
+esac
+"""
+
+
+@dataclass(slots=True, frozen=True)
+class RepoInfo:
+    """Metadata of a repository to back up."""
+    name: str
+    full_name: str
+    private: bool
+    fork: bool
+    clone_url: str
+    archived: bool
+    updated_at: Optional[datetime]
+    pushed_at: Optional[datetime]
+    
+    @classmethod
+    def from_json(cls, data: Dict) -> "RepoInfo":
+        """Build a RepoInfo from a repository object of the REST API."""
+        return cls(
+            name=data['name'],
+            full_name=data['full_name'],
+            private=data['private'],
+            fork=data['fork'],
+            clone_url=data['clone_url'],
+            archived=data['archived'],
+            updated_at=parse_timestamp(data.get('updated_at')),
+            pushed_at=parse_timestamp(data.get('pushed_at'))
+        )
+
 
 class GitHubRepoBackup:
     """GitHub repository backup utility."""
     
-    def __init__(self, token: str, backup_path: Optional[str] = None):
-        """Initialize with GitHub token and backup path."""
-        self.github = Github(token)
+    def __init__(self, token: str, backup_path: Optional[str] = None, working_tree: bool = False,
+                 depth: Optional[int] = None, blobless: bool = False, verbose: bool = False,
+                 github: Optional[Github] = None, use_cache: bool = True):
+        """Initialize with GitHub token and backup path, and optionally a client to share."""
+        # 100 is the API maximum page size, cutting listing requests ~3x
+        self.github = github or Github(token, per_page=100)
         self.console = Console()
+        self.verbose = verbose
         self.backup_path = Path(backup_path) if backup_path else Path.home() / "Developer" / "Github" / "Backup"
+        # Category directories, built once instead of per repository
+        self._dir_public = self.backup_path / "public"
+        self._dir_private = self.backup_path / "private"
+        self._dir_forks = self.backup_path / "forks"
+        # Keep-alive session for the REST calls, used concurrently by the page
+        # fetches and the workers' parent lookups (GET only, no shared state
+        # is mutated); unchanged responses are revalidated from the disk cache
+        self._session = create_session(token, use_cache=use_cache)
+        # Bare mirror clones by default; full checkouts only when requested
+        self.working_tree = working_tree
+        # Bare clones of fork parents, shared as object stores by every fork
+        self.reference_dir = self.backup_path / ".cache" / "reference"
+        self._reference_locks: Dict[str, threading.Lock] = {}
+        self._reference_locks_guard = threading.Lock()
+        self._fresh_references: set = set()
+        # Optional history trimming applied to new clones
+        self.depth = depth
+        self.blobless = blobless
+        # Serializes console output from the clone/update worker threads
+        self._print_lock = threading.Lock()
+        self._credentials = pygit2.UserPass('x-access-token', token) if pygit2 else None
+        self._askpass = self._write_askpass_script()
+        self._git_env = {
+            **os.environ,
+            'GITHUB_TOKEN': token,
+            'GIT_ASKPASS': self._askpass,
+            'GIT_TERMINAL_PROMPT': '0'
+        }
+        
+    @staticmethod
+    def _write_askpass_script() -> str:
+        """Write the GIT_ASKPASS helper to a private temp file, removed at exit."""
+        fd, path = tempfile.mkstemp(prefix='repo-tools-askpass-', suffix='.sh')
+        with os.fdopen(fd, 'w') as f:
+            f.write(ASKPASS_SCRIPT)
+        os.chmod(path, stat.S_IRWXU)
+        atexit.register(lambda: os.path.exists(path) and os.unlink(path))
+        return path
+        
+    def _run_git(self, cmd: List[str], timeout: int) -> Tuple[int, str]:
+        """Run a git command, streaming its stderr instead of buffering it.
+        
+        Returns the exit code and the last few stderr lines. Raises
+        subprocess.TimeoutExpired if the command runs longer than timeout.
+        """
+        tail = deque(maxlen=STDERR_TAIL_LINES)
+        timed_out = threading.Event()
+        with subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            text=True, bufsize=1, env=self._git_env
+        ) as process:
+            def kill():
+                timed_out.set()
+                process.kill()
+            
+            # Reading stderr blocks until git exits, so the timeout is enforced by a timer
+            timer = threading.Timer(timeout, kill)
+            timer.start()
+            try:
+                for line in process.stderr:
+                    tail.append(line.rstrip())
+                returncode = process.wait()
+            finally:
+                timer.cancel()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return returncode, "\n".join(tail)
+    
+    def _print(self, *args, **kwargs) -> None:
+        """Print to the console without interleaving output from worker threads."""
+        with self._print_lock:
+            self.console.print(*args, **kwargs)
         
     def validate_token(self) -> bool:
         """Validate the GitHub token and check permissions."""
         try:
             user = self.github.get_user()
-            rate_limit = self.github.get_rate_limit()
-            
             self.console.print(f"✓ Authenticated as: [bold green]{user.login}[/bold green]")
-            self.console.print(f"✓ Rate limit: {rate_limit.core.remaining}/{rate_limit.core.limit}")
+            
+            # One more API request, so only made when asked for
+            if self.verbose:
+                rate_limit = self.github.get_rate_limit()
+                self.console.print(f"✓ Rate limit: {rate_limit.core.remaining}/{rate_limit.core.limit}")
             
             return True
         except GithubException as e:
@@ -81,9 +250,9 @@ class GitHubRepoBackup:
             self.backup_path.mkdir(parents=True, exist_ok=True)
             
             # Create subdirectories for organization
-            (self.backup_path / "public").mkdir(exist_ok=True)
-            (self.backup_path / "private").mkdir(exist_ok=True)
-            (self.backup_path / "forks").mkdir(exist_ok=True)
+            self._dir_public.mkdir(exist_ok=True)
+            self._dir_private.mkdir(exist_ok=True)
+            self._dir_forks.mkdir(exist_ok=True)
             
             self.console.print(f"✓ Backup directory ready: [bold blue]{self.backup_path}[/bold blue]")
             return True
@@ -91,51 +260,62 @@ class GitHubRepoBackup:
             self.console.print(f"[bold red]✗ Error creating backup directories:[/bold red] {str(e)}")
             return False
     
-    def get_all_repositories(self) -> List[Dict[str, Any]]:
-        """Get all repositories with metadata."""
+    def _fetch_repository_page(self, page: int) -> requests.Response:
+        """Fetch one page of the authenticated user's repositories."""
+        response = self._session.get(
+            f"{GITHUB_API_URL}/user/repos",
+            params={'type': 'all', 'per_page': REPOS_PER_PAGE, 'page': page},
+            timeout=30
+        )
+        response.raise_for_status()
+        return response
+    
+    def get_all_repositories(self) -> List[RepoInfo]:
+        """Get all repositories with metadata.
+        
+        The first page reveals the page count through its Link header; the
+        remaining pages are then requested concurrently.
+        """
         try:
-            repos = []
-            user = self.github.get_user()
-            
             self.console.print("📦 Fetching repository list...")
             
-            for repo in user.get_repos(type='all'):
-                repos.append({
-                    'name': repo.name,
-                    'full_name': repo.full_name,
-                    'description': repo.description or '',
-                    'private': repo.private,
-                    'fork': repo.fork,
-                    'clone_url': repo.clone_url,
-                    'ssh_url': repo.ssh_url,
-                    'html_url': repo.html_url,
-                    'stars': repo.stargazers_count,
-                    'forks': repo.forks_count,
-                    'language': repo.language,
-                    'updated_at': repo.updated_at,
-                    'size': repo.size,
-                    'archived': repo.archived,
-                    'default_branch': repo.default_branch
-                })
+            first_page = self._fetch_repository_page(1)
+            pages = [decode_json(first_page)]
             
-            return repos
-        except GithubException as e:
-            self.console.print(f"[bold red]✗ GitHub API Error:[/bold red] {e.data.get('message', str(e))}")
+            last_link = first_page.links.get('last')
+            last_page = int(parse_qs(urlparse(last_link['url']).query)['page'][0]) if last_link else 1
+            if last_page > 1:
+                with ThreadPoolExecutor(max_workers=min(last_page - 1, DEFAULT_JOBS)) as executor:
+                    pages += [decode_json(response) for response in
+                              executor.map(self._fetch_repository_page, range(2, last_page + 1))]
+            
+            return [RepoInfo.from_json(data) for page in pages for data in page]
+        except requests.HTTPError as e:
+            try:
+                message = e.response.json().get('message', str(e))
+            except ValueError:
+                message = str(e)
+            self.console.print(f"[bold red]✗ GitHub API Error:[/bold red] {message}")
             return []
         except Exception as e:
             self.console.print(f"[bold red]✗ Error fetching repositories:[/bold red] {str(e)}")
             return []
     
-    def display_backup_summary(self, repos: List[Dict[str, Any]]) -> None:
+    def display_backup_summary(self, repos: List[RepoInfo]) -> None:
         """Display backup summary table."""
         if not repos:
             self.console.print("[yellow]No repositories found to backup.[/yellow]")
             return
         
-        # Categorize repositories
-        public_repos = [r for r in repos if not r['private'] and not r['fork']]
-        private_repos = [r for r in repos if r['private'] and not r['fork']]
-        forks = [r for r in repos if r['fork']]
+        # Categorize repositories in a single pass
+        public_count = private_count = fork_count = 0
+        for r in repos:
+            if r.fork:
+                fork_count += 1
+            elif r.private:
+                private_count += 1
+            else:
+                public_count += 1
         
         # Create summary table
         table = Table(title="📊 Backup Summary")
@@ -143,98 +323,339 @@ class GitHubRepoBackup:
         table.add_column("Count", justify="right", style="magenta")
         table.add_column("Details", style="white")
         
-        table.add_row("Public Repos", str(len(public_repos)), "Regular public repositories")
-        table.add_row("Private Repos", str(len(private_repos)), "Regular private repositories")
-        table.add_row("Forks", str(len(forks)), "Forked repositories")
+        table.add_row("Public Repos", str(public_count), "Regular public repositories")
+        table.add_row("Private Repos", str(private_count), "Regular private repositories")
+        table.add_row("Forks", str(fork_count), "Forked repositories")
         table.add_row("Total", str(len(repos)), "All repositories")
         
         self.console.print(table)
         self.console.print(f"\n📁 Backup location: [bold blue]{self.backup_path}[/bold blue]")
     
-    def get_backup_subdirectory(self, repo: Dict[str, Any]) -> Path:
+    def get_backup_subdirectory(self, repo: RepoInfo) -> Path:
         """Determine the appropriate backup subdirectory for a repository."""
-        if repo['fork']:
-            return self.backup_path / "forks"
-        elif repo['private']:
-            return self.backup_path / "private"
+        if repo.fork:
+            return self._dir_forks
+        elif repo.private:
+            return self._dir_private
         else:
-            return self.backup_path / "public"
+            return self._dir_public
     
-    def clone_repository(self, repo: Dict[str, Any], dry_run: bool = False) -> bool:
-        """Clone a single repository."""
-        repo_name = repo['name']
+    def get_repository_path(self, repo: RepoInfo) -> Path:
+        """Determine the local path of a repository's backup."""
         backup_dir = self.get_backup_subdirectory(repo)
-        repo_path = backup_dir / repo_name
+        if self.working_tree:
+            return backup_dir / repo.name
+        return backup_dir / f"{repo.name}.git"
+    
+    def _git_dir(self, repo_path: Path) -> Path:
+        """Return the git directory of a backup (the mirror itself or its .git)."""
+        return repo_path / ".git" if self.working_tree else repo_path
+    
+    def is_backed_up(self, repo_path: Path) -> bool:
+        """Check whether a repository backup already exists at the given path."""
+        # A single stat of the marker file; a missing parent directory is also a miss
+        marker = repo_path / ".git" if self.working_tree else repo_path / "HEAD"
+        try:
+            os.stat(marker)
+            return True
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+    
+    def _reference_lock(self, parent_full_name: str) -> threading.Lock:
+        """Return the lock guarding the reference repository of a fork parent."""
+        with self._reference_locks_guard:
+            return self._reference_locks.setdefault(parent_full_name, threading.Lock())
+    
+    def prepare_reference(self, repo: RepoInfo) -> Optional[Path]:
+        """Create or refresh the shared reference repository for a fork's parent.
+        
+        Returns the reference path, or None when the parent cannot be resolved
+        or cloned, in which case the fork is cloned without a reference.
+        """
+        try:
+            # The parent is not part of the repository listing, so it is only
+            # looked up for forks that are actually being cloned. It is read
+            # from the raw repository JSON, which the HTTP cache revalidates
+            # by ETag, rather than through a PyGithub Repository object.
+            response = self._session.get(f"{GITHUB_API_URL}/repos/{repo.full_name}", timeout=30)
+            response.raise_for_status()
+            parent = decode_json(response).get('parent')
+            if parent is None:
+                return None
+            parent_name = parent['full_name']
+            
+            reference_path = self.reference_dir / f"{parent_name}.git"
+            with self._reference_lock(parent_name):
+                if parent_name in self._fresh_references:
+                    return reference_path
+                
+                if (reference_path / "HEAD").exists():
+                    # A bare clone has no remote.origin.fetch refspec, so the
+                    # branches and tags are named explicitly; otherwise only
+                    # FETCH_HEAD would move and the reference would go stale
+                    cmd = ['git', '-c', 'credential.helper=', '-C', str(reference_path), 'fetch', '--prune',
+                           'origin', '+refs/heads/*:refs/heads/*', '+refs/tags/*:refs/tags/*']
+                    timeout = 60
+                else:
+                    reference_path.parent.mkdir(parents=True, exist_ok=True)
+                    cmd = ['git', '-c', 'credential.helper=', 'clone', '--bare', parent['clone_url'], str(reference_path)]
+                    timeout = 300
+                
+                returncode, _ = self._run_git(cmd, timeout)
+                if returncode != 0 and not (reference_path / "HEAD").exists():
+                    return None
+                
+                self._fresh_references.add(parent_name)
+                return reference_path
+        except Exception:
+            return None
+    
+    @staticmethod
+    def _init_mirror_remote(repository, name, url):
+        """Create the origin remote of a pygit2 clone with git's --mirror layout."""
+        remote = repository.remotes.create(name, url, '+refs/*:refs/*')
+        repository.config[f'remote.{name}.mirror'] = True
+        return remote
+    
+    def _pygit2_callbacks(self, timeout: int):
+        """Build pygit2 remote callbacks that abort the transfer after timeout seconds.
+        
+        libgit2 has no overall timeout; raising from the progress callback
+        cancels the operation, which the callers then hand to the git CLI.
+        """
+        deadline = time.monotonic() + timeout
+        callbacks = pygit2.RemoteCallbacks(credentials=self._credentials)
         
-        # Skip if already exists and is a git repository
-        if repo_path.exists() and (repo_path / ".git").exists():
-            self.console.print(f"⏭️  [yellow]Skipping {repo_name} (already exists)[/yellow]")
+        def transfer_progress(stats):
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"pygit2 transfer exceeded {timeout}s")
+        
+        callbacks.transfer_progress = transfer_progress
+        return callbacks
+    
+    def _pygit2_clone(self, repo: RepoInfo, repo_path: Path) -> bool:
+        """Mirror-clone a repository with libgit2, returning False to fall back to git."""
+        # libgit2 has no partial clones or --reference; those stay on the git CLI
+        if not pygit2 or self.working_tree or self.depth or self.blobless or repo.fork:
+            return False
+        
+        try:
+            pygit2.clone_repository(
+                repo.clone_url, str(repo_path), bare=True,
+                remote=self._init_mirror_remote, callbacks=self._pygit2_callbacks(CLONE_TIMEOUT)
+            )
+            return True
+        except Exception:
+            # Clear any partial clone so the git CLI starts from scratch
+            shutil.rmtree(repo_path, ignore_errors=True)
+            return False
+    
+    def _pygit2_update(self, repo_path: Path) -> bool:
+        """Fetch a mirror with libgit2, returning False to fall back to git."""
+        if not pygit2 or self.working_tree:
+            return False
+        
+        try:
+            repository = pygit2.Repository(str(repo_path))
+            # Shallow and partial clones are only handled correctly by git itself
+            if repository.is_shallow or 'remote.origin.partialclonefilter' in repository.config:
+                return False
+            repository.remotes['origin'].fetch(
+                callbacks=self._pygit2_callbacks(UPDATE_TIMEOUT), prune=pygit2.GIT_FETCH_PRUNE
+            )
             return True
+        except Exception:
+            return False
+    
+    def clone_repository(self, repo: RepoInfo, dry_run: bool = False,
+                         repo_path: Optional[Path] = None) -> bool:
+        """Clone a single repository.
+        
+        Callers that already resolved and checked the backup path pass it as
+        repo_path to skip the lookup and existence check.
+        """
+        repo_name = repo.name
+        if repo_path is None:
+            repo_path = self.get_repository_path(repo)
+            
+            # Skip if already exists and is a git repository
+            if self.is_backed_up(repo_path):
+                self._print(f"⏭️  [yellow]Skipping {repo_name} (already exists)[/yellow]")
+                return True
         
         if dry_run:
-            self.console.print(f"📋 [cyan]Would clone:[/cyan] {repo['full_name']} → {repo_path}")
+            self._print(f"📋 [cyan]Would clone:[/cyan] {repo.full_name} → {repo_path}")
+            return True
+        
+        if self._pygit2_clone(repo, repo_path):
+            self._print(f"✅ [green]Cloned:[/green] {repo_name}")
             return True
         
         try:
-            # Use HTTPS clone URL with token for authentication
-            clone_url = repo['clone_url']
-            if clone_url.startswith('https://github.com/'):
-                # Insert token into URL for authentication
-                token = os.getenv('GITHUB_TOKEN')
-                clone_url = clone_url.replace('https://github.com/', f'https://{token}@github.com/')
-            
-            # Clone the repository
-            cmd = ['git', 'clone', clone_url, str(repo_path)]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            # Clone the repository (bare mirror unless a working tree was requested).
+            # Authentication goes through GIT_ASKPASS; stored credential helpers
+            # are bypassed so a stale keychain entry cannot shadow the token.
+            cmd = ['git', '-c', 'credential.helper=', 'clone']
+            if not self.working_tree:
+                cmd.append('--mirror')
+            if self.depth:
+                cmd += ['--depth', str(self.depth), '--no-single-branch']
+            if self.blobless:
+                cmd.append('--filter=blob:none')
+            if repo.fork:
+                # Copy objects shared with the upstream from the local reference
+                # instead of downloading them again. --dissociate keeps the fork
+                # self-contained: the reference prunes branches deleted upstream,
+                # and gc there would otherwise remove objects the fork still needs.
+                reference_path = self.prepare_reference(repo)
+                if reference_path:
+                    cmd += ['--reference-if-able', str(reference_path), '--dissociate']
+            cmd += [repo.clone_url, str(repo_path)]
+            returncode, stderr = self._run_git(cmd, timeout=CLONE_TIMEOUT)
             
-            if result.returncode == 0:
-                self.console.print(f"✅ [green]Cloned:[/green] {repo_name}")
+            if returncode == 0:
+                self._print(f"✅ [green]Cloned:[/green] {repo_name}")
                 return True
             else:
-                self.console.print(f"❌ [red]Failed to clone {repo_name}:[/red] {result.stderr.strip()}")
+                self._print(f"❌ [red]Failed to clone {repo_name}:[/red] {stderr}")
                 return False
                 
         except subprocess.TimeoutExpired:
-            self.console.print(f"❌ [red]Timeout cloning {repo_name}[/red]")
+            self._print(f"❌ [red]Timeout cloning {repo_name}[/red]")
             return False
         except Exception as e:
-            self.console.print(f"❌ [red]Error cloning {repo_name}:[/red] {str(e)}")
+            self._print(f"❌ [red]Error cloning {repo_name}:[/red] {str(e)}")
             return False
     
-    def update_repository(self, repo: Dict[str, Any], dry_run: bool = False) -> bool:
-        """Update an existing repository."""
-        repo_name = repo['name']
-        backup_dir = self.get_backup_subdirectory(repo)
-        repo_path = backup_dir / repo_name
+    def _dissociate(self, repo_path: Path) -> bool:
+        """Copy borrowed objects into a backup cloned against a fork reference.
         
-        if not repo_path.exists() or not (repo_path / ".git").exists():
+        Earlier versions cloned forks without --dissociate, leaving them
+        dependent on the reference's object store. Returns False when the
+        repack fails and the backup still borrows objects.
+        """
+        alternates = self._git_dir(repo_path) / "objects" / "info" / "alternates"
+        if not alternates.exists():
+            return True
+        
+        returncode, _ = self._run_git(['git', '-C', str(repo_path), 'repack', '-a', '-d'], timeout=300)
+        if returncode != 0:
             return False
+        alternates.unlink()
+        return True
+    
+    def update_repository(self, repo: RepoInfo, dry_run: bool = False,
+                          repo_path: Optional[Path] = None) -> bool:
+        """Update an existing repository.
+        
+        Callers that already resolved and checked the backup path pass it as
+        repo_path to skip the lookup and existence check.
+        """
+        repo_name = repo.name
+        if repo_path is None:
+            repo_path = self.get_repository_path(repo)
+            
+            if not self.is_backed_up(repo_path):
+                return False
         
         if dry_run:
-            self.console.print(f"📋 [cyan]Would update:[/cyan] {repo_name}")
+            self._print(f"📋 [cyan]Would update:[/cyan] {repo_name}")
+            return True
+        
+        if repo.fork:
+            try:
+                dissociated = self._dissociate(repo_path)
+            except subprocess.TimeoutExpired:
+                dissociated = False
+            if not dissociated:
+                self._print(f"⚠️  [yellow]{repo_name} still borrows objects from its fork reference[/yellow]")
+        
+        if self._pygit2_update(repo_path):
+            self._print(f"🔄 [blue]Updated:[/blue] {repo_name}")
             return True
         
         try:
-            # Pull latest changes
-            cmd = ['git', '-C', str(repo_path), 'pull', '--ff-only']
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            # Only keep trimming history on backups that were cloned shallow;
+            # a full backup must never be truncated by a later --depth run.
+            # Partial clones need no extra flags: git re-applies the filter
+            # stored in remote.origin.partialclonefilter on every fetch.
+            shallow_depth = None
+            if self.depth and (self._git_dir(repo_path) / "shallow").exists():
+                shallow_depth = ['--depth', str(self.depth)]
             
-            if result.returncode == 0:
-                self.console.print(f"🔄 [blue]Updated:[/blue] {repo_name}")
+            # Pull latest changes (mirrors refresh every ref and prune deleted ones)
+            cmd = ['git', '-c', 'credential.helper=', '-C', str(repo_path)]
+            if self.working_tree:
+                cmd += ['pull', '--ff-only'] + (shallow_depth or [])
+            elif shallow_depth:
+                cmd += ['fetch', '--prune'] + shallow_depth + ['origin']
+            else:
+                cmd += ['remote', 'update', '--prune']
+            returncode, stderr = self._run_git(cmd, timeout=UPDATE_TIMEOUT)
+            
+            if returncode == 0:
+                self._print(f"🔄 [blue]Updated:[/blue] {repo_name}")
                 return True
             else:
-                self.console.print(f"⚠️  [yellow]Could not update {repo_name}:[/yellow] {result.stderr.strip()}")
+                self._print(f"⚠️  [yellow]Could not update {repo_name}:[/yellow] {stderr}")
                 return False
                 
         except subprocess.TimeoutExpired:
-            self.console.print(f"❌ [red]Timeout updating {repo_name}[/red]")
+            self._print(f"❌ [red]Timeout updating {repo_name}[/red]")
             return False
         except Exception as e:
-            self.console.print(f"❌ [red]Error updating {repo_name}:[/red] {str(e)}")
+            self._print(f"❌ [red]Error updating {repo_name}:[/red] {str(e)}")
             return False
     
-    def backup_repositories(self, repos: List[Dict[str, Any]], dry_run: bool = False) -> None:
-        """Backup all repositories with progress tracking."""
+    @property
+    def manifest_path(self) -> Path:
+        """Path of the manifest recording each repository's state at its last backup."""
+        return self.backup_path / MANIFEST_NAME
+    
+    @staticmethod
+    def _manifest_stamp(repo: RepoInfo) -> str:
+        """Return the value recorded in the manifest for a repository's current state."""
+        # pushed_at moves on new commits, updated_at on metadata changes
+        stamps = [t for t in (repo.pushed_at, repo.updated_at) if t]
+        return max(stamps).isoformat() if stamps else ''
+    
+    def load_manifest(self) -> Dict[str, str]:
+        """Load the manifest written by the previous backup run."""
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def save_manifest(self, manifest: Dict[str, str]) -> None:
+        """Atomically replace the manifest so an interrupted run never corrupts it."""
+        tmp_path = self.manifest_path.with_name(MANIFEST_NAME + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            self.console.print(f"⚠️  [yellow]Could not save backup manifest:[/yellow] {str(e)}")
+    
+    def _process_one(self, repo: RepoInfo, repo_path: Path, backed_up: bool,
+                     dry_run: bool = False) -> Tuple[str, str]:
+        """Clone or update a single repository, returning (status, name)."""
+        repo_name = repo.name
+        if backed_up:
+            return ('updated' if self.update_repository(repo, dry_run, repo_path) else 'failed'), repo_name
+        return ('cloned' if self.clone_repository(repo, dry_run, repo_path) else 'failed'), repo_name
+    
+    def backup_repositories(self, repos: List[RepoInfo], dry_run: bool = False,
+                            jobs: Optional[int] = DEFAULT_JOBS, force_update: bool = False,
+                            include_archived: bool = False) -> None:
+        """Backup all repositories concurrently with progress tracking.
+        
+        Repositories already backed up whose state matches the previous run's
+        manifest are skipped without running git, unless force_update is set.
+        Archived repositories are read-only, so once backed up they are skipped
+        unless include_archived is set.
+        """
         if not repos:
             self.console.print("[yellow]No repositories to backup.[/yellow]")
             return
@@ -242,6 +663,25 @@ class GitHubRepoBackup:
         successful = 0
         failed = 0
         updated = 0
+        unchanged = 0
+        skipped_archived = 0
+        
+        previous = {} if force_update else self.load_manifest()
+        manifest = {}
+        pending = []
+        for repo in repos:
+            # Resolve and check each backup path exactly once per run
+            repo_path = self.get_repository_path(repo)
+            backed_up = self.is_backed_up(repo_path)
+            stamp = self._manifest_stamp(repo)
+            if backed_up and repo.archived and not include_archived:
+                manifest[repo.full_name] = stamp
+                skipped_archived += 1
+            elif backed_up and previous.get(repo.full_name) == stamp:
+                manifest[repo.full_name] = stamp
+                unchanged += 1
+            else:
+                pending.append((repo, repo_path, backed_up))
         
         with Progress(
             SpinnerColumn(),
@@ -251,28 +691,36 @@ class GitHubRepoBackup:
             console=self.console
         ) as progress:
             
-            backup_task = progress.add_task("Backing up repositories...", total=len(repos))
+            backup_task = progress.add_task("Backing up repositories...", total=len(repos),
+                                            completed=unchanged + skipped_archived)
             
-            for repo in repos:
-                repo_name = repo['name']
-                backup_dir = self.get_backup_subdirectory(repo)
-                repo_path = backup_dir / repo_name
+            with ThreadPoolExecutor(max_workers=jobs or DEFAULT_JOBS) as executor:
+                futures = {
+                    executor.submit(self._process_one, repo, repo_path, backed_up, dry_run): repo
+                    for repo, repo_path, backed_up in pending
+                }
                 
-                progress.update(backup_task, description=f"Processing {repo_name}...")
-                
-                # Check if repository already exists
-                if repo_path.exists() and (repo_path / ".git").exists():
-                    if self.update_repository(repo, dry_run):
-                        updated += 1
-                    else:
-                        failed += 1
-                else:
-                    if self.clone_repository(repo, dry_run):
+                for future in as_completed(futures):
+                    repo = futures[future]
+                    repo_name = repo.name
+                    try:
+                        status, repo_name = future.result()
+                    except Exception as e:
+                        self._print(f"❌ [red]Error processing {repo_name}:[/red] {str(e)}")
+                        status = 'failed'
+                    
+                    if status == 'cloned':
                         successful += 1
+                    elif status == 'updated':
+                        updated += 1
                     else:
                         failed += 1
-                
-                progress.update(backup_task, advance=1)
+                    
+                    # Failed repositories are left out so the next run retries them
+                    if status != 'failed':
+                        manifest[repo.full_name] = self._manifest_stamp(repo)
+                    
+                    progress.update(backup_task, advance=1, description=f"Processed {repo_name}")
         
         # Display final summary
         self.console.print("\n📊 Backup Complete!")
@@ -282,11 +730,16 @@ class GitHubRepoBackup:
         
         summary_table.add_row("✅ Newly cloned", str(successful))
         summary_table.add_row("🔄 Updated", str(updated))
+        summary_table.add_row("⏭️  Unchanged", str(unchanged))
+        summary_table.add_row("📦 Skipped (archived)", str(skipped_archived))
         summary_table.add_row("❌ Failed", str(failed))
         summary_table.add_row("📦 Total processed", str(len(repos)))
         
         self.console.print(summary_table)
         
+        if not dry_run:
+            self.save_manifest(manifest)
+        
         if failed > 0:
             self.console.print(f"\n⚠️  [yellow]{failed} repositories failed to backup. Check the logs above for details.[/yellow]")
 
@@ -294,13 +747,25 @@ class GitHubRepoBackup:
 def main():
     """Main function."""
     # Load environment variables
-    load_dotenv()
+    load_env()
+    install_orjson_decoder()
     
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Backup GitHub repositories')
     parser.add_argument('--backup-path', type=str, help='Custom backup directory path')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be done without actually cloning')
+    parser.add_argument('--working-tree', action='store_true', help='Clone full working-tree checkouts instead of bare mirrors')
+    parser.add_argument('--depth', type=int, help='Shallow-clone new repositories with only the latest N commits')
+    parser.add_argument('--blobless', action='store_true', help='With --working-tree, partial-clone new checkouts and fetch old file contents from GitHub on demand')
+    parser.add_argument('--force-update', action='store_true', help='Update every repository, even those unchanged since the last run')
+    parser.add_argument('--include-archived', action='store_true', help='Also update archived repositories that are already backed up')
+    parser.add_argument('--verbose', action='store_true', help='Also report the remaining API rate limit')
+    parser.add_argument('--no-cache', action='store_true', help='Do not use the on-disk HTTP cache for the repository listing')
+    parser.add_argument('--jobs', type=int, default=DEFAULT_JOBS, help=f'Number of concurrent clone/update workers (default: {DEFAULT_JOBS})')
     args = parser.parse_args()
+    # A blobless mirror holds no file contents at all, not even the latest
+    if args.blobless and not args.working_tree:
+        parser.error("--blobless requires --working-tree")
     
     # Get GitHub token
     token = os.getenv('GITHUB_TOKEN')
@@ -313,7 +778,14 @@ def main():
     backup_path = args.backup_path or os.getenv('BACKUP_PATH')
     
     # Initialize backup manager
-    backup_manager = GitHubRepoBackup(token, backup_path)
+    backup_manager = GitHubRepoBackup(
+        token, backup_path,
+        working_tree=args.working_tree,
+        depth=args.depth,
+        blobless=args.blobless,
+        verbose=args.verbose,
+        use_cache=not args.no_cache
+    )
     
     # Validate token
     if not backup_manager.validate_token():
@@ -338,7 +810,11 @@ def main():
             sys.exit(0)
     
     # Perform backup
-    backup_manager.backup_repositories(repos, args.dry_run)
+    backup_manager.backup_repositories(
+        repos, args.dry_run, args.jobs,
+        force_update=args.force_update,
+        include_archived=args.include_archived
+    )
 
 
 if __name__ == "__main__":
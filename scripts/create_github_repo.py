@@ -31,137 +31,6 @@ Examples:
 import argparse
 import os
 import sys
-import subprocess
-from pathlib import Path
-from typing import Optional
-
-try:
-    from github import Github, GithubException
-    from rich.console import Console
-    from rich.prompt import Confirm, Prompt
-    from dotenv import load_dotenv
-except ImportError as e:
-    print(f"Missing required dependency: {e}")
-    print("Install with: pip install -r requirements.txt")
-    sys.exit(1)
-
-
-def create_github_repository(
-    token: str,
-    repo_name: str,
-    description: str = "",
-    private: bool = False,
-    has_issues: bool = True,
-    has_wiki: bool = False,
-    has_projects: bool = False,
-    auto_init: bool = False
-) -> bool:
-    """Create a new GitHub repository with specified settings."""
-    console = Console()
-    
-    try:
-        # Initialize GitHub client
-        github = Github(token)
-        user = github.get_user()
-        
-        console.print(f"Creating repository: [bold blue]{repo_name}[/bold blue]")
-        console.print(f"Description: {description or 'No description'}")
-        console.print(f"Private: {private}")
-        console.print(f"Issues: {has_issues}, Wiki: {has_wiki}, Projects: {has_projects}")
-        
-        # Check if repository already exists
-        try:
-            existing_repo = user.get_repo(repo_name)
-            console.print(f"[bold yellow]Repository '{repo_name}' already exists![/bold yellow]")
-            console.print(f"URL: {existing_repo.html_url}")
-            return True
-        except GithubException as e:
-            if e.status != 404:
-                raise e
-            # Repository doesn't exist, which is what we want
-            pass
-        
-        # Create the repository
-        repo = user.create_repo(
-            name=repo_name,
-            description=description,
-            private=private,
-            has_issues=has_issues,
-            has_wiki=has_wiki,
-            has_downloads=True,
-            has_projects=has_projects,
-            auto_init=auto_init
-        )
-        
-        console.print(f"✓ Repository created successfully!")
-        console.print(f"URL: [bold green]{repo.html_url}[/bold green]")
-        console.print(f"Clone URL: {repo.clone_url}")
-        console.print(f"SSH URL: {repo.ssh_url}")
-        
-        return True
-        
-    except GithubException as e:
-        console.print(f"[bold red]✗ GitHub API Error:[/bold red] {e.data.get('message', str(e))}")
-        return False
-    except Exception as e:
-        console.print(f"[bold red]✗ Error creating repository:[/bold red] {str(e)}")
-        return False
-
-
-def setup_git_remote(repo_name: str = "Repo-Tools") -> bool:
-    """Set up git remote for the new repository."""
-    console = Console()
-    
-    try:
-        # Get GitHub username from git config
-        result = subprocess.run(
-            ["git", "config", "user.name"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        username = result.stdout.strip()
-        
-        if not username:
-            console.print("[bold red]✗ Could not determine GitHub username from git config[/bold red]")
-            return False
-        
-        # Add remote origin
-        remote_url = f"git@github.com:{username}/{repo_name}.git"
-        
-        # Check if remote already exists
-        try:
-            subprocess.run(
-                ["git", "remote", "get-url", "origin"],
-                capture_output=True,
-                check=True
-            )
-            console.print("[bold yellow]Remote 'origin' already exists[/bold yellow]")
-            
-            # Ask if user wants to update it
-            if Confirm.ask("Update remote origin URL?"):
-                subprocess.run(
-                    ["git", "remote", "set-url", "origin", remote_url],
-                    check=True
-                )
-                console.print(f"✓ Updated remote origin to: {remote_url}")
-            return True
-            
-        except subprocess.CalledProcessError:
-            # Remote doesn't exist, add it
-            subprocess.run(
-                ["git", "remote", "add", "origin", remote_url],
-                check=True
-            )
-            console.print(f"✓ Added remote origin: {remote_url}")
-            return True
-            
-    except subprocess.CalledProcessError as e:
-        console.print(f"[bold red]✗ Git command failed:[/bold red] {e}")
-        return False
-    except Exception as e:
-        console.print(f"[bold red]✗ Error setting up git remote:[/bold red] {str(e)}")
-        return False
 
 
 def main():
@@ -188,10 +57,24 @@ Examples:
     
     args = parser.parse_args()
     
+    # Imported only once argparse has handled --help and usage errors, so
+    # those answer without loading rich, dotenv and PyGithub
+    try:
+        from rich.console import Console
+        from rich.prompt import Confirm, Prompt
+    except ImportError as e:
+        print(f"Missing required dependency: {e}")
+        print("Install with: pip install -r requirements.txt")
+        sys.exit(1)
+    
+    from github_ops import CREATE_NEXT_STEPS, SETTINGS_TEMPLATE, create_github_repository, setup_git_remote
+    from github_session import install_orjson_decoder, load_env
+    
     console = Console()
     
     # Load environment variables
-    load_dotenv()
+    load_env()
+    install_orjson_decoder()
     
     # Get GitHub token
     token = os.getenv("GITHUB_TOKEN")
@@ -226,15 +109,16 @@ Examples:
     has_projects = args.enable_projects
     auto_init = args.auto_init
     
-    # Display settings summary
-    console.print(f"\n[bold]Repository Settings:[/bold]")
-    console.print(f"Name: {repo_name}")
-    console.print(f"Description: {description or 'No description'}")
-    console.print(f"Private: {private}")
-    console.print(f"Initialize with README: {auto_init}")
-    console.print(f"Issues: {has_issues}")
-    console.print(f"Wiki: {has_wiki}")
-    console.print(f"Projects: {has_projects}")
+    # Display settings summary in a single print
+    console.print("\n" + SETTINGS_TEMPLATE.format_map({
+        'name': repo_name,
+        'description': description or 'No description',
+        'private': private,
+        'auto_init': auto_init,
+        'has_issues': has_issues,
+        'has_wiki': has_wiki,
+        'has_projects': has_projects
+    }))
     
     if not Confirm.ask("\nProceed with repository creation?", default=True):
         console.print("Repository creation cancelled.")
@@ -252,10 +136,7 @@ Examples:
             if setup_git_remote(repo_name):
                 console.print("\n[bold green]Git remote configured![/bold green]")
                 if not auto_init:
-                    console.print("\nNext steps:")
-                    console.print("1. git add .")
-                    console.print("2. git commit -m 'Initial commit'")
-                    console.print("3. git push -u origin main")
+                    console.print("\n" + "\n".join(CREATE_NEXT_STEPS))
             else:
                 console.print("\n[bold yellow]Repository created but git remote setup failed[/bold yellow]")
                 console.print("You can manually add the remote with:")
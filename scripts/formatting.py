@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Display Formatting Helpers
+
+Small, pure text formatters shared by the repository tables of the listing
+and privacy tools. Results depend only on their arguments, so they are
+memoized: a table with hundreds of rows formats each distinct value once.
+"""
+
+import functools
+
+
+@functools.lru_cache(maxsize=512)
+def human_days(days: int) -> str:
+    """Describe an age given in whole days, e.g. "Yesterday" or "3 weeks ago"."""
+    if days == 0:
+        return "Today"
+    elif days == 1:
+        return "Yesterday"
+    elif days < 7:
+        return f"{days} days ago"
+    elif days < 30:
+        weeks = days // 7
+        return f"{weeks} week{'s' if weeks > 1 else ''} ago"
+    elif days < 365:
+        months = days // 30
+        return f"{months} month{'s' if months > 1 else ''} ago"
+    else:
+        years = days // 365
+        return f"{years} year{'s' if years > 1 else ''} ago"
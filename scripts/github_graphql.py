@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+GitHub GraphQL Repository Listing
+
+Fetches the authenticated user's repositories through the GitHub GraphQL API.
+
+One query returns exactly the fields the tools display (including a fork's
+parent) for 100 repositories at a time, instead of full REST repository
+objects plus a follow-up request per fork. Results are slim RepoSummary
+records; a PyGithub Repository is only fetched when a repository is
+actually modified.
+
+search_repos() runs a repository search with the same fields, so callers
+that only need a filtered subset can let GitHub do the filtering.
+"""
+
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+try:
+    import requests
+except ImportError as e:
+    print(f"Missing required dependency: {e}")
+    print("Install with: pip install -r requirements.txt")
+    sys.exit(1)
+
+from github_session import GITHUB_API_URL, decode_json, parse_timestamp
+
+
+GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+# GraphQL connections return at most 100 nodes per request
+NODES_PER_PAGE = 100
+# Search never returns more matches than this, however many pages are read
+SEARCH_RESULT_LIMIT = 1000
+
+# Fields of every RepoSummary, shared by the listing and search queries
+REPOSITORY_FIELDS = """
+fragment RepositoryFields on Repository {
+  name
+  nameWithOwner
+  description
+  primaryLanguage { name }
+  isPrivate
+  isFork
+  stargazerCount
+  forkCount
+  updatedAt
+  createdAt
+  url
+  parent { nameWithOwner }
+}
+"""
+
+# Affiliations match the REST /user/repos default (owner, collaborator,
+# organization_member); newest activity first like sort=updated
+REPOSITORIES_QUERY = """
+query($first: Int!, $cursor: String) {
+  viewer {
+    repositories(
+      first: $first,
+      after: $cursor,
+      affiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER],
+      ownerAffiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER],
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      nodes { ...RepositoryFields }
+      pageInfo { endCursor hasNextPage }
+    }
+  }
+}
+""" + REPOSITORY_FIELDS
+
+SEARCH_QUERY = """
+query($query: String!, $first: Int!, $cursor: String) {
+  search(query: $query, type: REPOSITORY, first: $first, after: $cursor) {
+    repositoryCount
+    nodes { ...RepositoryFields }
+    pageInfo { endCursor hasNextPage }
+  }
+}
+""" + REPOSITORY_FIELDS
+
+@dataclass(slots=True, frozen=True)
+class RepoSummary:
+    """The fields of one repository that the tools display or act on."""
+    name: str
+    full_name: str
+    description: str
+    language: str
+    private: bool
+    fork: bool
+    stars: int
+    forks: int
+    updated: Optional[datetime]
+    created: Optional[datetime]
+    url: str
+    parent_name: Optional[str]
+
+
+class GraphQLError(Exception):
+    """Raised when the GraphQL API answers with errors."""
+
+
+def _summary_from_node(node: dict) -> RepoSummary:
+    """Build a RepoSummary from a repository node of the query above."""
+    language = node['primaryLanguage']
+    parent = node['parent']
+    return RepoSummary(
+        name=node['name'],
+        full_name=node['nameWithOwner'],
+        description=node['description'] or "",
+        language=language['name'] if language else "None",
+        private=node['isPrivate'],
+        fork=node['isFork'],
+        stars=node['stargazerCount'],
+        forks=node['forkCount'],
+        updated=parse_timestamp(node['updatedAt']),
+        created=parse_timestamp(node['createdAt']),
+        url=node['url'],
+        parent_name=parent['nameWithOwner'] if parent else None
+    )
+
+
+def run_query(session: requests.Session, query: str, variables: Optional[dict] = None) -> dict:
+    """Execute a GraphQL query and return its data.
+    
+    Raises requests.HTTPError for HTTP failures and GraphQLError when the
+    API reports errors without returning any data. Partial results are
+    returned as they are: repositories the token cannot read, such as those
+    of an organization enforcing SAML SSO, come back as null nodes next to
+    an error entry, and are left out like the REST listing leaves them out.
+    """
+    response = session.post(
+        GRAPHQL_URL,
+        json={'query': query, 'variables': variables or {}},
+        timeout=30
+    )
+    response.raise_for_status()
+    payload = decode_json(response)
+    if payload.get('data') is None:
+        errors = payload.get('errors') or [{'message': "response carried no data"}]
+        raise GraphQLError("; ".join(error.get('message', str(error)) for error in errors))
+    return payload['data']
+
+
+def fetch_all_repos(session: requests.Session, limit: Optional[int] = None) -> List[RepoSummary]:
+    """Fetch the authenticated user's repositories, most recently updated first.
+    
+    Pages are followed by cursor until every repository (or ``limit`` of
+    them) has been read.
+    """
+    repos = []
+    cursor = None
+    
+    while limit is None or len(repos) < limit:
+        first = NODES_PER_PAGE if limit is None else min(NODES_PER_PAGE, limit - len(repos))
+        data = run_query(session, REPOSITORIES_QUERY, {'first': first, 'cursor': cursor})
+        
+        connection = data['viewer']['repositories']
+        # Skip null nodes of repositories the token cannot read (see run_query)
+        repos.extend(_summary_from_node(node) for node in connection['nodes'] if node)
+        
+        page_info = connection['pageInfo']
+        if not page_info['hasNextPage']:
+            break
+        cursor = page_info['endCursor']
+    
+    return repos
+
+
+def search_repos(session: requests.Session, query: str) -> Optional[List[RepoSummary]]:
+    """Fetch the repositories matching a GitHub search query.
+    
+    Returns None when more than SEARCH_RESULT_LIMIT repositories match,
+    since search cannot return them all; callers then list instead.
+    """
+    repos = []
+    cursor = None
+    
+    while True:
+        data = run_query(session, SEARCH_QUERY, {'query': query, 'first': NODES_PER_PAGE, 'cursor': cursor})
+        
+        search = data['search']
+        if search['repositoryCount'] > SEARCH_RESULT_LIMIT:
+            return None
+        # Only repositories match a REPOSITORY search, but skip null nodes
+        # of results the token cannot read (see run_query)
+        repos.extend(_summary_from_node(node) for node in search['nodes'] if node)
+        
+        page_info = search['pageInfo']
+        if not page_info['hasNextPage']:
+            return repos
+        cursor = page_info['endCursor']
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+GitHub Repository Operations
+
+Library functions behind repository creation: creating a repository through
+the GitHub API and pointing the local git remote at it. Shared by main.py's
+create command and the standalone create_github_repo.py script, neither of
+which needs the other's argument parsing or prompts.
+"""
+
+import sys
+import subprocess
+from typing import Optional
+
+try:
+    import requests
+    from github import Github, GithubException
+    from rich.console import Console
+    from rich.prompt import Confirm
+except ImportError as e:
+    print(f"Missing required dependency: {e}")
+    print("Install with: pip install -r requirements.txt")
+    sys.exit(1)
+
+from github_session import GITHUB_API_URL, create_session
+
+
+# Summary confirmed before a repository is created; rendered with format_map
+SETTINGS_TEMPLATE = (
+    "[bold]Repository Settings:[/bold]\n"
+    "Name: {name}\n"
+    "Description: {description}\n"
+    "Private: {private}\n"
+    "Initialize with README: {auto_init}\n"
+    "Issues: {has_issues}\n"
+    "Wiki: {has_wiki}\n"
+    "Projects: {has_projects}"
+)
+
+# Shown after the remote of a new, empty repository is configured
+CREATE_NEXT_STEPS = (
+    "Next steps:",
+    "1. git add .",
+    "2. git commit -m 'Initial commit'",
+    "3. git push -u origin main",
+)
+
+
+# Client reused across calls so later requests share its pooled HTTPS connections
+_gh_client: Optional[Github] = None
+_gh_client_token: Optional[str] = None
+
+
+def _client(token: str) -> Github:
+    """Return the shared GitHub client for a token, creating it on first use."""
+    global _gh_client, _gh_client_token
+    if _gh_client is None or _gh_client_token != token:
+        _gh_client = Github(token, per_page=100, retry=3, pool_size=10)
+        _gh_client_token = token
+    return _gh_client
+
+
+_session: Optional[requests.Session] = None
+_session_token: Optional[str] = None
+
+
+def _http_session(token: str) -> requests.Session:
+    """Return the keep-alive session for a token, used for lightweight REST probes."""
+    global _session, _session_token
+    if _session is None or _session_token != token:
+        _session = create_session(token)
+        _session_token = token
+    return _session
+
+
+def _repo_exists(session: requests.Session, owner: str, name: str) -> Optional[str]:
+    """Check whether a repository exists with a body-less HEAD request.
+    
+    Returns the repository's web URL if it exists and None if it does not;
+    any other response raises requests.HTTPError.
+    """
+    # Always ask GitHub: a cached answer could predate a deletion or rename
+    response = session.head(
+        f"{GITHUB_API_URL}/repos/{owner}/{name}",
+        headers={"Cache-Control": "no-cache"},
+        allow_redirects=False,
+        timeout=15
+    )
+    if response.status_code == 200:
+        return f"https://github.com/{owner}/{name}"
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    # Renamed repositories answer with a redirect to their new location
+    return None
+
+
+def create_github_repository(
+    token: str,
+    repo_name: str,
+    description: str = "",
+    private: bool = False,
+    has_issues: bool = True,
+    has_wiki: bool = False,
+    has_projects: bool = False,
+    auto_init: bool = False,
+    gh: Optional[Github] = None
+) -> bool:
+    """Create a new GitHub repository with specified settings.
+    
+    Uses the given client, or the shared client for the token if none is passed.
+    """
+    console = Console()
+    
+    try:
+        github = gh or _client(token)
+        user = github.get_user()
+        
+        console.print(f"Creating repository: [bold blue]{repo_name}[/bold blue]")
+        console.print(f"Description: {description or 'No description'}")
+        console.print(f"Private: {private}")
+        console.print(f"Issues: {has_issues}, Wiki: {has_wiki}, Projects: {has_projects}")
+        
+        # Create the repository; a name conflict is reported by the API as a
+        # 422, so no separate existence check is needed on the happy path
+        try:
+            repo = user.create_repo(
+                name=repo_name,
+                description=description,
+                private=private,
+                has_issues=has_issues,
+                has_wiki=has_wiki,
+                has_downloads=True,
+                has_projects=has_projects,
+                auto_init=auto_init
+            )
+        except GithubException as e:
+            if e.status != 422 or 'already exists' not in str(e.data):
+                raise e
+            existing_url = _repo_exists(_http_session(token), user.login, repo_name)
+            if existing_url is None:
+                raise e
+            console.print(f"[bold yellow]Repository '{repo_name}' already exists![/bold yellow]")
+            console.print(f"URL: {existing_url}")
+            return True
+        
+        console.print(f"✓ Repository created successfully!")
+        console.print(f"URL: [bold green]{repo.html_url}[/bold green]")
+        console.print(f"Clone URL: {repo.clone_url}")
+        console.print(f"SSH URL: {repo.ssh_url}")
+        
+        return True
+        
+    except GithubException as e:
+        console.print(f"[bold red]✗ GitHub API Error:[/bold red] {e.data.get('message', str(e))}")
+        return False
+    except Exception as e:
+        console.print(f"[bold red]✗ Error creating repository:[/bold red] {str(e)}")
+        return False
+
+
+def _read_git_config(*keys: str) -> dict:
+    """Read several git config keys with a single git process.
+    
+    Missing keys are absent from the result; when a key is set at several
+    levels the last (most specific) value wins, as with 'git config <key>'.
+    """
+    pattern = "^(" + "|".join(key.replace(".", r"\.") for key in keys) + ")$"
+    result = subprocess.run(
+        ["git", "config", "--null", "--get-regexp", pattern],
+        capture_output=True,
+        text=True
+    )
+    # Exit code 1 just means none of the keys are set
+    if result.returncode not in (0, 1):
+        raise subprocess.CalledProcessError(result.returncode, result.args, result.stdout, result.stderr)
+    
+    values = {}
+    for entry in result.stdout.split("\0"):
+        if entry:
+            key, _, value = entry.partition("\n")
+            values[key] = value
+    return values
+
+
+def setup_git_remote(repo_name: str = "Repo-Tools", assume_yes: bool = False) -> bool:
+    """Set up git remote for the new repository.
+    
+    With assume_yes an existing origin is updated without asking.
+    """
+    console = Console()
+    
+    try:
+        # One read for the GitHub username and any existing origin;
+        # git only runs again when the remote actually has to change
+        config = _read_git_config("user.name", "remote.origin.url")
+        username = config.get("user.name", "").strip()
+        
+        if not username:
+            console.print("[bold red]✗ Could not determine GitHub username from git config[/bold red]")
+            return False
+        
+        remote_url = f"git@github.com:{username}/{repo_name}.git"
+        
+        if "remote.origin.url" not in config:
+            subprocess.run(
+                ["git", "remote", "add", "origin", remote_url],
+                check=True
+            )
+            console.print(f"✓ Added remote origin: {remote_url}")
+            return True
+        
+        console.print("[bold yellow]Remote 'origin' already exists[/bold yellow]")
+        
+        # Ask if user wants to update it
+        if assume_yes or Confirm.ask("Update remote origin URL?"):
+            subprocess.run(
+                ["git", "remote", "set-url", "origin", remote_url],
+                check=True
+            )
+            console.print(f"✓ Updated remote origin to: {remote_url}")
+        return True
+            
+    except subprocess.CalledProcessError as e:
+        console.print(f"[bold red]✗ Git command failed:[/bold red] {e}")
+        return False
+    except Exception as e:
+        console.print(f"[bold red]✗ Error setting up git remote:[/bold red] {str(e)}")
+        return False
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+GitHub HTTP Session Helper
+
+Builds the keep-alive requests session used for direct GitHub REST calls
+(the parts of the tools that bypass PyGithub), and loads the shared .env
+file for the standalone scripts through load_env().
+
+When the optional orjson package is installed, install_orjson_decoder()
+makes PyGithub decode its API responses with it instead of the stdlib json
+module, and decode_json() does the same for responses of these sessions.
+
+When the optional requests-cache package is installed, GET and HEAD responses
+are kept in an SQLite cache on disk and revalidated with ETag/If-None-Match.
+GitHub answers unchanged resources with 304 Not Modified, which carries no
+body and does not count against the API rate limit, so re-running a command
+shortly after the previous run is close to free.
+
+Cache location: ~/.cache/repo-tools/http.sqlite
+"""
+
+import os
+import sys
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+try:
+    import requests
+    from dotenv import load_dotenv
+except ImportError as e:
+    print(f"Missing required dependency: {e}")
+    print("Install with: pip install -r requirements.txt")
+    sys.exit(1)
+
+try:
+    # Optional: persistent HTTP cache with conditional revalidation
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    # Optional: faster JSON decoding of PyGithub's responses
+    import orjson
+except ImportError:
+    orjson = None
+
+
+GITHUB_API_URL = "https://api.github.com"
+# The repository-root .env shared with main.py, loaded by explicit path so
+# python-dotenv skips its parent-directory search
+ENV_FILE = Path(__file__).resolve().parent.parent / ".env"
+CACHE_PATH = Path.home() / ".cache" / "repo-tools" / "http"
+# Fallback lifetime for responses without caching headers; GitHub normally
+# sends its own max-age, after which entries are revalidated via ETag
+CACHE_EXPIRE_SECONDS = 1800
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a GitHub ISO 8601 timestamp such as 2024-01-31T12:00:00Z."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00')) if value else None
+
+
+def load_env() -> None:
+    """Load the repository-root .env file unless GITHUB_TOKEN is already exported.
+    
+    A token exported in the shell makes the .env file irrelevant, so it is
+    not read at all in that case.
+    """
+    if not os.environ.get('GITHUB_TOKEN'):
+        load_dotenv(dotenv_path=ENV_FILE, override=False)
+
+
+def fetch_login_and_rate_limit(github):
+    """Return the authenticated login and the rate limit of a PyGithub client.
+    
+    /user and /rate_limit are independent, so they are requested together,
+    saving one round trip on the tools' token checks.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        login = executor.submit(lambda: github.get_user().login)
+        rate_limit = executor.submit(github.get_rate_limit)
+        return login.result(), rate_limit.result()
+
+
+class _OrjsonDecoding:
+    """Stand-in for the json module in PyGithub's Requester.
+    
+    Decoding goes through orjson; any other attribute, such as dumps for
+    request bodies, still comes from the stdlib json module.
+    """
+    
+    @staticmethod
+    def loads(data, **kwargs):
+        return orjson.loads(data)
+    
+    def __getattr__(self, name):
+        return getattr(json, name)
+
+
+def install_orjson_decoder() -> None:
+    """Make PyGithub parse API responses with orjson when it is installed."""
+    if orjson is None:
+        return
+    
+    # PyGithub calls json.loads through its module-level import
+    import github.Requester as requester_module
+    if not isinstance(requester_module.json, _OrjsonDecoding):
+        requester_module.json = _OrjsonDecoding()
+
+
+def decode_json(response: requests.Response):
+    """Decode a response body as JSON, with orjson when it is installed."""
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def create_session(token: str, use_cache: bool = True) -> requests.Session:
+    """Create an authenticated GitHub API session, cached on disk when possible."""
+    if use_cache and requests_cache is not None:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        session = requests_cache.CachedSession(
+            str(CACHE_PATH),
+            backend="sqlite",
+            cache_control=True,
+            expire_after=CACHE_EXPIRE_SECONDS,
+            allowable_methods=("GET", "HEAD")
+        )
+    else:
+        session = requests.Session()
+    
+    session.headers.update({
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json"
+    })
+    return session
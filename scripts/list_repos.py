@@ -19,34 +19,51 @@ Example:
 
 import os
 import sys
-from datetime import datetime
+from collections import Counter
+from datetime import datetime, timezone
+from textwrap import shorten
+from operator import attrgetter
 from typing import List, Optional
 
 try:
+    import requests
     from github import Github, GithubException
     from rich.console import Console
     from rich.table import Table
     from rich.text import Text
-    from dotenv import load_dotenv
 except ImportError as e:
     print(f"Missing required dependency: {e}")
     print("Install with: pip install -r requirements.txt")
     sys.exit(1)
 
+from formatting import human_days
+from github_graphql import GraphQLError, RepoSummary, fetch_all_repos
+from github_session import create_session, fetch_login_and_rate_limit, install_orjson_decoder, load_env
+
+
+# "Type" column label for each (private, fork) combination
+REPO_TYPE_LABELS = {
+    (False, False): "🌐 Public",
+    (True, False): "🔒 Private",
+    (False, True): "🌐 Public\n🍴 Fork",
+    (True, True): "🔒 Private\n🍴 Fork",
+}
+
 
 class GitHubRepoLister:
     """GitHub repository listing utility."""
     
-    def __init__(self, token: str):
-        """Initialize with GitHub token."""
-        self.github = Github(token)
+    def __init__(self, token: str, github: Optional[Github] = None):
+        """Initialize with GitHub token, or an existing client to share."""
+        self.github = github or Github(token, per_page=100)
         self.console = Console()
+        # GraphQL listing session; POST responses are never cached
+        self._session = create_session(token, use_cache=False)
     
     def validate_token(self) -> bool:
         """Validate the GitHub token and check rate limits."""
         try:
-            user = self.github.get_user()
-            rate_limit = self.github.get_rate_limit()
+            login, rate_limit = fetch_login_and_rate_limit(self.github)
             
             # Check if we have sufficient API calls remaining
             if rate_limit.core.remaining < 10:
@@ -55,68 +72,37 @@ class GitHubRepoLister:
                     f"Resets at {rate_limit.core.reset}[/yellow]"
                 )
             
-            self.console.print(f"[green]Authenticated as: {user.login}[/green]")
+            self.console.print(f"[green]Authenticated as: {login}[/green]")
             return True
             
         except GithubException as e:
             self.console.print(f"[red]Authentication failed: {e.data['message']}[/red]")
             return False
     
-    def get_repositories(self, limit: Optional[int] = None) -> List:
+    def get_repositories(self, limit: Optional[int] = None) -> List[RepoSummary]:
         """Fetch user repositories sorted by stars, then by last updated date."""
         try:
-            repos = []
-            user = self.github.get_user()
+            # Most recently updated first, so a limit stops pagination once
+            # enough rows are read
+            repos = fetch_all_repos(self._session, limit=limit)
             
-            # Get all repositories for the authenticated user
-            repo_count = 0
-            for repo in user.get_repos(sort="updated", direction="desc"):
-                if limit and repo_count >= limit:
-                    break
-                    
-                repos.append({
-                    'name': repo.name,
-                    'description': repo.description or "",
-                    'language': repo.language or "None",
-                    'private': repo.private,
-                    'fork': repo.fork,
-                    'stars': repo.stargazers_count,
-                    'forks': repo.forks_count,
-                    'updated': repo.updated_at,
-                    'created': repo.created_at,
-                    'url': repo.html_url
-                })
-                repo_count += 1
-            
-            # Sort by stars (descending) first, then by updated date (descending)
-            repos.sort(key=lambda x: (-x['stars'], -x['updated'].timestamp()))
+            # Sort by stars (descending) first, then by updated date (descending):
+            # two stable sorts on C-level keys, with no per-row timestamp() call.
+            # The listing already arrives newest first, so the first is ~O(n).
+            repos.sort(key=attrgetter('updated'), reverse=True)
+            repos.sort(key=attrgetter('stars'), reverse=True)
             
             return repos
             
-        except GithubException as e:
-            self.console.print(f"[red]Error fetching repositories: {e.data['message']}[/red]")
+        except (requests.RequestException, GraphQLError) as e:
+            self.console.print(f"[red]Error fetching repositories: {e}[/red]")
             return []
     
-    def format_date(self, date: datetime) -> str:
-        """Format datetime for display."""
-        now = datetime.now(date.tzinfo)
-        diff = now - date
-        
-        if diff.days == 0:
-            return "Today"
-        elif diff.days == 1:
-            return "Yesterday"
-        elif diff.days < 7:
-            return f"{diff.days} days ago"
-        elif diff.days < 30:
-            weeks = diff.days // 7
-            return f"{weeks} week{'s' if weeks > 1 else ''} ago"
-        elif diff.days < 365:
-            months = diff.days // 30
-            return f"{months} month{'s' if months > 1 else ''} ago"
-        else:
-            years = diff.days // 365
-            return f"{years} year{'s' if years > 1 else ''} ago"
+    def format_date(self, date: datetime, now: Optional[datetime] = None) -> str:
+        """Format datetime for display; pass now to reuse one clock reading per table."""
+        if now is None:
+            now = datetime.now(date.tzinfo)
+        return human_days((now - date).days)
     
     def create_table(self, repos: List, compact: bool = False) -> Table:
         """Create a Rich table from repository data."""
@@ -128,37 +114,36 @@ class GitHubRepoLister:
     def _create_compact_table(self, repos: List) -> Table:
         """Create a compact table for many repositories."""
         table = Table(title="GitHub Repositories", show_header=True, header_style="bold blue", 
-                     box=None, show_lines=False)
+                     box=None, show_lines=False, pad_edge=False, collapse_padding=True)
         
-        # Add columns with better spacing
-        table.add_column("Repository", style="cyan bold", min_width=25, max_width=30)
-        table.add_column("Language", style="green", justify="center", min_width=10)
-        table.add_column("⭐", justify="right", style="yellow", min_width=4)
-        table.add_column("🍴", justify="right", style="blue", min_width=4)
-        table.add_column("Type", justify="center", min_width=10)
-        table.add_column("Updated", style="magenta", min_width=12)
+        # Add columns with better spacing; cells are clipped rather than
+        # wrapped, so Rich never measures line breaks for long names
+        table.add_column("Repository", style="cyan bold", min_width=25, max_width=30,
+                         no_wrap=True, overflow="ellipsis")
+        table.add_column("Language", style="green", justify="center", min_width=10,
+                         no_wrap=True, overflow="ellipsis")
+        table.add_column("⭐", justify="right", style="yellow", min_width=4, no_wrap=True)
+        table.add_column("🍴", justify="right", style="blue", min_width=4, no_wrap=True)
+        table.add_column("Type", justify="center", min_width=10, no_wrap=True)
+        table.add_column("Updated", style="magenta", min_width=12, no_wrap=True)
         
-        # Add rows
-        for repo in repos:
-            # Format repository type (visibility + fork status)
-            if repo['private']:
-                visibility = "🔒 Private"
-            else:
-                visibility = "🌐 Public"
-            
-            if repo['fork']:
-                repo_type = f"{visibility}\n� Fork"
-            else:
-                repo_type = visibility
-            
-            table.add_row(
-                repo['name'],
-                repo['language'],
-                str(repo['stars']),
-                str(repo['forks']),
-                repo_type,
-                self.format_date(repo['updated'])
+        # Add rows, formatted by a generator as they are added. Cells are
+        # plain Text, which Rich renders without parsing console markup
+        # (so a "[" in a repository name is shown as-is)
+        now = datetime.now(timezone.utc)
+        rows = (
+            (
+                Text(repo.name),
+                Text(repo.language),
+                Text(format(repo.stars, 'd')),
+                Text(format(repo.forks, 'd')),
+                Text(REPO_TYPE_LABELS[repo.private, repo.fork]),
+                Text(self.format_date(repo.updated, now))
             )
+            for repo in repos
+        )
+        for row in rows:
+            table.add_row(*row)
         
         return table
     
@@ -175,40 +160,23 @@ class GitHubRepoLister:
         table.add_column("Type", justify="center", min_width=12)
         table.add_column("Updated", style="magenta", min_width=12)
         
-        # Add rows
-        for repo in repos:
-            # Format repository type (visibility + fork status)
-            if repo['private']:
-                visibility = "🔒 Private"
-            else:
-                visibility = "🌐 Public"
-            
-            if repo['fork']:
-                repo_type = f"{visibility}\n🍴 Fork"
-            else:
-                repo_type = visibility
-            
-            # Smart description truncation - preserve word boundaries
-            description = repo['description']
-            if len(description) > 42:  # Reduced to accommodate wider Type column
-                words = description.split()
-                truncated = ""
-                for word in words:
-                    if len(truncated + word + " ") <= 39:
-                        truncated += word + " "
-                    else:
-                        break
-                description = truncated.strip() + "..."
-            
-            table.add_row(
-                repo['name'],
-                description,
-                repo['language'],
-                str(repo['stars']),
-                str(repo['forks']),
-                repo_type,
-                self.format_date(repo['updated'])
+        # Add rows, formatted by a generator as they are added; long
+        # descriptions are truncated at a word boundary
+        now = datetime.now(timezone.utc)
+        rows = (
+            (
+                repo.name,
+                shorten(repo.description, width=42, placeholder="..."),
+                repo.language,
+                format(repo.stars, 'd'),
+                format(repo.forks, 'd'),
+                REPO_TYPE_LABELS[repo.private, repo.fork],
+                self.format_date(repo.updated, now)
             )
+            for repo in repos
+        )
+        for row in rows:
+            table.add_row(*row)
         
         return table
     
@@ -230,32 +198,33 @@ class GitHubRepoLister:
         table = self.create_table(repos, compact)
         self.console.print(table)
         
-        # Display summary with better formatting
-        total_stars = sum(repo['stars'] for repo in repos)
-        total_forks = sum(repo['forks'] for repo in repos)
+        # Gather the summary totals in a single pass over the rows
+        total_stars = total_forks = private_count = fork_count = 0
+        for repo in repos:
+            total_stars += repo.stars
+            total_forks += repo.forks
+            private_count += repo.private
+            fork_count += repo.fork
+        
+        # Count languages in Counter's C loop, then drop repos without one
+        languages = Counter(map(attrgetter('language'), repos))
+        languages.pop("None", None)
         
+        # Display summary with better formatting
         self.console.print(f"\n[bold cyan]Repository Summary[/bold cyan]")
         self.console.print(f"📊 Total repositories: [yellow]{len(repos)}[/yellow]")
         self.console.print(f"⭐ Total stars: [yellow]{total_stars:,}[/yellow]")
         self.console.print(f"🍴 Total forks: [yellow]{total_forks:,}[/yellow]")
         
-        private_count = sum(1 for repo in repos if repo['private'])
         public_count = len(repos) - private_count
-        fork_count = sum(1 for repo in repos if repo['fork'])
         original_count = len(repos) - fork_count
         
         self.console.print(f"🌐 Public: [green]{public_count}[/green] | 🔒 Private: [red]{private_count}[/red]")
         self.console.print(f"📝 Original: [blue]{original_count}[/blue] | 🍴 Forks: [yellow]{fork_count}[/yellow]")
         
         # Show language breakdown
-        languages = {}
-        for repo in repos:
-            lang = repo['language']
-            if lang != "None":
-                languages[lang] = languages.get(lang, 0) + 1
-        
         if languages:
-            top_languages = sorted(languages.items(), key=lambda x: x[1], reverse=True)[:5]
+            top_languages = languages.most_common(5)
             lang_str = " | ".join([f"{lang}: {count}" for lang, count in top_languages])
             self.console.print(f"💻 Top languages: [dim]{lang_str}[/dim]")
 
@@ -263,7 +232,8 @@ class GitHubRepoLister:
 def main():
     """Main entry point."""
     # Load environment variables
-    load_dotenv()
+    load_env()
+    install_orjson_decoder()
     
     # Get GitHub token
     token = os.getenv('GITHUB_TOKEN')
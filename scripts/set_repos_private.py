@@ -20,33 +20,58 @@ Example:
 """
 import os
 import sys
-from typing import List, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from textwrap import shorten
+from typing import Callable, List, Optional, Tuple
 
 try:
+    import requests
     from github import Github, GithubException
     from rich.console import Console
     from rich.table import Table
     from rich.prompt import Confirm
-    from dotenv import load_dotenv
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
 except ImportError as e:
     print(f"Missing required dependency: {e}")
     print("Install with: pip install -r requirements.txt")
     sys.exit(1)
 
+from formatting import human_days
+from github_graphql import GraphQLError, RepoSummary, fetch_all_repos, search_repos
+from github_session import create_session, fetch_login_and_rate_limit, install_orjson_decoder, load_env
+
+
+# Repositories edited or deleted concurrently; kept low because GitHub's
+# secondary rate limits penalize bursts of write requests
+MUTATION_WORKERS = 8
+# Extra attempts per repository after a secondary rate limit response
+MAX_RATE_LIMIT_RETRIES = 3
+# Seconds to wait when GitHub does not send Retry-After
+DEFAULT_RETRY_AFTER = 60
+
 
 class GitHubPrivacyManager:
     """GitHub repository privacy management utility."""
     
-    def __init__(self, token: str):
-        """Initialize with GitHub token."""
-        self.github = Github(token)
+    def __init__(self, token: str, github: Optional[Github] = None, owner: Optional[str] = None):
+        """Initialize with GitHub token, or an existing client to share.
+        
+        Passing the account's login as owner saves a /user lookup.
+        """
+        self.github = github or Github(token, per_page=100)
         self.console = Console()
+        self.owner = owner
+        # GraphQL listing session; POST responses are never cached
+        self._session = create_session(token, use_cache=False)
+        # Candidates found by the last preview, reused by the real run
+        self._preview = None
     
     def validate_token(self) -> bool:
         """Validate the GitHub token and check permissions."""
         try:
-            user = self.github.get_user()
-            rate_limit = self.github.get_rate_limit()
+            login, rate_limit = fetch_login_and_rate_limit(self.github)
             
             # Check if we have sufficient API calls remaining
             if rate_limit.core.remaining < 20:
@@ -55,58 +80,52 @@ class GitHubPrivacyManager:
                     f"Resets at {rate_limit.core.reset}[/yellow]"
                 )
             
-            self.console.print(f"[green]Authenticated as: {user.login}[/green]")
+            self.console.print(f"[green]Authenticated as: {login}[/green]")
+            # Reuse the login for the candidate search
+            self.owner = self.owner or login
             return True
             
         except GithubException as e:
             self.console.print(f"[red]Authentication failed: {e.data['message']}[/red]")
             return False
     
-    def find_zero_star_public_repos(self) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    def find_zero_star_public_repos(self) -> tuple[List[RepoSummary], List[RepoSummary]]:
         """Find public repositories with zero stars, separating regular repos from forks."""
         try:
             repos = []
             forks = []
-            user = self.github.get_user()
             
             self.console.print("[bold]Scanning repositories for zero-star public repos...[/bold]")
             
-            for repo in user.get_repos():
-                # Check if repo is public and has zero stars
-                if not repo.private and repo.stargazers_count == 0:
-                    repo_data = {
-                        'name': repo.name,
-                        'description': repo.description or "No description",
-                        'language': repo.language or "None",
-                        'forks': repo.forks_count,
-                        'updated': repo.updated_at,
-                        'created': repo.created_at,
-                        'url': repo.html_url,
-                        'repo_obj': repo  # Keep reference for modification
-                    }
-                    
+            owner = self.owner or self.github.get_user().login
+            
+            # Let search pick the candidates server-side; it is capped at 1000
+            # matches, beyond which every repository is listed and filtered.
+            # Fork parents come back in the same query, so no per-fork lookups.
+            candidates = search_repos(self._session, f"user:{owner} is:public stars:0 fork:true")
+            if candidates is None:
+                candidates = fetch_all_repos(self._session)
+            
+            for repo in candidates:
+                # Check if repo is public, has zero stars and is the user's own
+                # (search results may lag behind the latest star or visibility)
+                if not repo.private and repo.stars == 0 and repo.full_name.startswith(f"{owner}/"):
                     if repo.fork:
-                        # Add upstream repository info for forks
-                        try:
-                            parent = repo.parent
-                            repo_data['parent_name'] = parent.full_name if parent else "Unknown"
-                        except:
-                            repo_data['parent_name'] = "Unknown"
-                        forks.append(repo_data)
+                        forks.append(repo)
                     else:
-                        repos.append(repo_data)
+                        repos.append(repo)
             
             # Sort both lists by most recently updated first
-            repos.sort(key=lambda x: x['updated'], reverse=True)
-            forks.sort(key=lambda x: x['updated'], reverse=True)
+            repos.sort(key=lambda x: x.updated, reverse=True)
+            forks.sort(key=lambda x: x.updated, reverse=True)
             
             return repos, forks
             
-        except GithubException as e:
-            self.console.print(f"[red]Error fetching repositories: {e.data['message']}[/red]")
+        except (requests.RequestException, GraphQLError, GithubException) as e:
+            self.console.print(f"[red]Error fetching repositories: {e}[/red]")
             return [], []
     
-    def display_candidates(self, repos: List[Dict[str, Any]]) -> None:
+    def display_candidates(self, repos: List[RepoSummary]) -> None:
         """Display repositories that would be made private."""
         if not repos:
             self.console.print("[green]No public repositories with zero stars found![/green]")
@@ -121,27 +140,19 @@ class GitHubPrivacyManager:
         table.add_column("Forks", justify="right", style="blue", min_width=5)
         table.add_column("Last Updated", style="magenta", min_width=12)
         
+        now = datetime.now(timezone.utc)
         for repo in repos:
-            # Smart description truncation
-            description = repo['description']
-            if len(description) > 47:
-                words = description.split()
-                truncated = ""
-                for word in words:
-                    if len(truncated + word + " ") <= 44:
-                        truncated += word + " "
-                    else:
-                        break
-                description = truncated.strip() + "..."
+            # Truncate long descriptions at a word boundary
+            description = shorten(repo.description or "No description", width=47, placeholder="...")
             
             # Format date
-            updated = self._format_date(repo['updated'])
+            updated = human_days((now - repo.updated).days)
             
             table.add_row(
-                repo['name'],
+                repo.name,
                 description,
-                repo['language'],
-                str(repo['forks']),
+                repo.language,
+                str(repo.forks),
                 updated
             )
         
@@ -149,30 +160,7 @@ class GitHubPrivacyManager:
         self.console.print(f"\n[bold yellow]Found {len(repos)} public repositories with zero stars[/bold yellow]")
         self.console.print("[dim]Note: Forks are automatically excluded from processing[/dim]")
     
-    def _format_date(self, date) -> str:
-        """Format datetime for display."""
-        from datetime import datetime
-        
-        now = datetime.now(date.tzinfo)
-        diff = now - date
-        
-        if diff.days == 0:
-            return "Today"
-        elif diff.days == 1:
-            return "Yesterday"
-        elif diff.days < 7:
-            return f"{diff.days} days ago"
-        elif diff.days < 30:
-            weeks = diff.days // 7
-            return f"{weeks} week{'s' if weeks > 1 else ''} ago"
-        elif diff.days < 365:
-            months = diff.days // 30
-            return f"{months} month{'s' if months > 1 else ''} ago"
-        else:
-            years = diff.days // 365
-            return f"{years} year{'s' if years > 1 else ''} ago"
-    
-    def display_forks(self, forks: List[Dict[str, Any]]) -> None:
+    def display_forks(self, forks: List[RepoSummary]) -> None:
         """Display fork repositories that would be deleted."""
         if not forks:
             return
@@ -185,27 +173,19 @@ class GitHubPrivacyManager:
         table.add_column("Language", style="green", justify="center", min_width=10)
         table.add_column("Last Updated", style="magenta", min_width=12)
         
+        now = datetime.now(timezone.utc)
         for fork in forks:
-            # Smart description truncation
-            description = fork['description']
-            if len(description) > 37:
-                words = description.split()
-                truncated = ""
-                for word in words:
-                    if len(truncated + word + " ") <= 34:
-                        truncated += word + " "
-                    else:
-                        break
-                description = truncated.strip() + "..."
+            # Truncate long descriptions at a word boundary
+            description = shorten(fork.description or "No description", width=37, placeholder="...")
             
             # Format date
-            updated = self._format_date(fork['updated'])
+            updated = human_days((now - fork.updated).days)
             
             table.add_row(
-                fork['name'],
-                fork['parent_name'],
+                fork.name,
+                fork.parent_name or "Unknown",
                 description,
-                fork['language'],
+                fork.language,
                 updated
             )
         
@@ -213,7 +193,126 @@ class GitHubPrivacyManager:
         self.console.print(f"\n[bold yellow]Found {len(forks)} forked repositories with zero stars[/bold yellow]")
         self.console.print("[dim]Note: Forks will be deleted (not made private) if you proceed[/dim]")
     
-    def handle_forks(self, forks: List[Dict[str, Any]]) -> None:
+    @staticmethod
+    def _with_backoff(action: Callable[[], None]) -> None:
+        """Run one API mutation, waiting out GitHub's secondary rate limit.
+        
+        PyGithub already retries these responses a few times; this covers
+        bursts that outlast its retries, since the mutations run concurrently.
+        """
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            try:
+                action()
+                return
+            except GithubException as e:
+                message = str(e.data).lower() if e.data else ""
+                if (e.status not in (403, 429) or 'secondary rate limit' not in message
+                        or attempt == MAX_RATE_LIMIT_RETRIES):
+                    raise
+                headers = e.headers or {}
+                retry_after = headers.get('Retry-After') or headers.get('retry-after')
+                time.sleep(int(retry_after) if retry_after else DEFAULT_RETRY_AFTER)
+    
+    def _delete_fork(self, fork: RepoSummary) -> Tuple[bool, List[str]]:
+        """Delete one fork; returns success and the lines to report."""
+        try:
+            self._with_backoff(lambda: self.github.get_repo(fork.full_name).delete())
+            return True, [f"[green]✓[/green] Deleted {fork.name}"]
+            
+        except GithubException as e:
+            error_msg = e.data.get('message', str(e)) if isinstance(e.data, dict) else str(e)
+            if 'Resource not accessible by personal access token' in error_msg:
+                return False, [
+                    f"[red]✗[/red] Failed to delete {fork.name}: Token lacks required permissions",
+                    f"[yellow]  Please ensure your token has 'delete_repo' scope[/yellow]"
+                ]
+            return False, [f"[red]✗[/red] Failed to delete {fork.name}: {error_msg}"]
+        
+        except Exception as e:
+            return False, [f"[red]✗[/red] Unexpected error deleting {fork.name}: {e}"]
+    
+    def _set_private(self, repo: RepoSummary) -> Tuple[bool, List[str]]:
+        """Make one repository private; returns success and the lines to report."""
+        repo_obj = None
+        
+        def make_private():
+            nonlocal repo_obj
+            # Only now fetch the full repository object to modify it
+            repo_obj = self.github.get_repo(repo.full_name)
+            repo_obj.edit(private=True)
+        
+        try:
+            self._with_backoff(make_private)
+            return True, [f"[green]✓[/green] Made {repo.name} private"]
+            
+        except GithubException as e:
+            error_msg = e.data.get('message', str(e)) if isinstance(e.data, dict) else str(e)
+            if 'Resource not accessible by personal access token' in error_msg:
+                return False, [
+                    f"[red]✗[/red] Failed to make {repo.name} private: Token lacks required permissions",
+                    f"[yellow]  Please ensure your token has 'repo' scope (full control of private repositories)[/yellow]"
+                ]
+            if 'Validation Failed' in error_msg and repo_obj is not None:
+                # Check for common reasons why validation might fail
+                reasons = []
+                
+                if repo_obj.has_pages:
+                    reasons.append("has GitHub Pages enabled")
+                if hasattr(repo_obj, 'template') and repo_obj.template:
+                    reasons.append("is a template repository")
+                
+                if reasons:
+                    reason_text = ", ".join(reasons)
+                    return False, [f"[red]✗[/red] Failed to make {repo.name} private: Repository {reason_text}"]
+                return False, [
+                    f"[red]✗[/red] Failed to make {repo.name} private: {error_msg}",
+                    f"[yellow]  This may be due to branch protection rules, GitHub Pages, or other repository settings[/yellow]"
+                ]
+            return False, [f"[red]✗[/red] Failed to make {repo.name} private: {error_msg}"]
+        
+        except Exception as e:
+            return False, [f"[red]✗[/red] Unexpected error with {repo.name}: {e}"]
+    
+    def _run_concurrently(self, action: Callable[[RepoSummary], Tuple[bool, List[str]]],
+                          repos: List[RepoSummary], description: str) -> Tuple[int, int, bool]:
+        """Apply action to the repositories on a thread pool behind a progress bar.
+        
+        Only failures are printed, above the bar; successes just advance it.
+        Returns the success count, the error count, and whether the run was
+        interrupted with Ctrl+C (pending repositories are then skipped).
+        """
+        success_count = 0
+        error_count = 0
+        executor = ThreadPoolExecutor(max_workers=min(MUTATION_WORKERS, len(repos)))
+        
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                console=self.console
+            ) as progress:
+                
+                task = progress.add_task(description, total=len(repos))
+                futures = [executor.submit(action, repo) for repo in repos]
+                for future in as_completed(futures):
+                    ok, lines = future.result()
+                    if ok:
+                        success_count += 1
+                    else:
+                        error_count += 1
+                        for line in lines:
+                            progress.console.print(line)
+                    progress.advance(task)
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            return success_count, error_count, True
+        
+        executor.shutdown()
+        return success_count, error_count, False
+    
+    def handle_forks(self, forks: List[RepoSummary]) -> None:
         """Handle zero-star fork repositories by deleting them."""
         if not forks:
             return
@@ -229,36 +328,10 @@ class GitHubPrivacyManager:
             self.console.print("[yellow]Skipping fork deletion[/yellow]")
             return
         
-        # Process fork deletions
-        success_count = 0
-        error_count = 0
-        
         self.console.print(f"\n[bold red]Deleting {len(forks)} forked repositories...[/bold red]")
+        success_count, error_count, interrupted = self._run_concurrently(self._delete_fork, forks, "Deleting forks...")
         
-        try:
-            for i, fork in enumerate(forks, 1):
-                self.console.print(f"[dim]({i}/{len(forks)})[/dim] Deleting {fork['name']}...")
-                
-                try:
-                    # Delete the forked repository
-                    fork['repo_obj'].delete()
-                    self.console.print(f"[green]✓[/green] Deleted {fork['name']}")
-                    success_count += 1
-                    
-                except GithubException as e:
-                    error_msg = e.data.get('message', str(e))
-                    if 'Resource not accessible by personal access token' in error_msg:
-                        self.console.print(f"[red]✗[/red] Failed to delete {fork['name']}: Token lacks required permissions")
-                        self.console.print(f"[yellow]  Please ensure your token has 'delete_repo' scope[/yellow]")
-                    else:
-                        self.console.print(f"[red]✗[/red] Failed to delete {fork['name']}: {error_msg}")
-                    error_count += 1
-                
-                except Exception as e:
-                    self.console.print(f"[red]✗[/red] Unexpected error deleting {fork['name']}: {e}")
-                    error_count += 1
-                    
-        except KeyboardInterrupt:
+        if interrupted:
             self.console.print(f"\n[yellow]Operation interrupted by user[/yellow]")
             self.console.print(f"[green]✓ Successfully deleted: {success_count}[/green]")
             if error_count > 0:
@@ -271,7 +344,7 @@ class GitHubPrivacyManager:
         if error_count > 0:
             self.console.print(f"[red]✗ Failed: {error_count}[/red]")
     
-    def make_repositories_private(self, repos: List[Dict[str, Any]], dry_run: bool = True) -> None:
+    def make_repositories_private(self, repos: List[RepoSummary], dry_run: bool = True) -> None:
         """Make the specified repositories private."""
         if not repos:
             return
@@ -280,7 +353,7 @@ class GitHubPrivacyManager:
             self.console.print("\n[bold blue]DRY RUN MODE - No changes will be made[/bold blue]")
             self.console.print("These repositories would be made private:")
             for repo in repos:
-                self.console.print(f"  • {repo['name']}")
+                self.console.print(f"  • {repo.name}")
             return
         
         # Confirm action
@@ -294,52 +367,10 @@ class GitHubPrivacyManager:
             self.console.print("[yellow]Operation cancelled[/yellow]")
             return
         
-        # Process repositories
-        success_count = 0
-        error_count = 0
-        
         self.console.print(f"\n[bold green]Processing {len(repos)} repositories...[/bold green]")
+        success_count, error_count, interrupted = self._run_concurrently(self._set_private, repos, "Making repositories private...")
         
-        try:
-            for i, repo in enumerate(repos, 1):
-                self.console.print(f"[dim]({i}/{len(repos)})[/dim] Processing {repo['name']}...")
-                
-                try:
-                    # Make repository private
-                    repo['repo_obj'].edit(private=True)
-                    self.console.print(f"[green]✓[/green] Made {repo['name']} private")
-                    success_count += 1
-                    
-                except GithubException as e:
-                    error_msg = e.data.get('message', str(e))
-                    if 'Resource not accessible by personal access token' in error_msg:
-                        self.console.print(f"[red]✗[/red] Failed to make {repo['name']} private: Token lacks required permissions")
-                        self.console.print(f"[yellow]  Please ensure your token has 'repo' scope (full control of private repositories)[/yellow]")
-                    elif 'Validation Failed' in error_msg:
-                        # Check for common reasons why validation might fail
-                        repo_obj = repo['repo_obj']
-                        reasons = []
-                        
-                        if repo_obj.has_pages:
-                            reasons.append("has GitHub Pages enabled")
-                        if hasattr(repo_obj, 'template') and repo_obj.template:
-                            reasons.append("is a template repository")
-                        
-                        if reasons:
-                            reason_text = ", ".join(reasons)
-                            self.console.print(f"[red]✗[/red] Failed to make {repo['name']} private: Repository {reason_text}")
-                        else:
-                            self.console.print(f"[red]✗[/red] Failed to make {repo['name']} private: {error_msg}")
-                            self.console.print(f"[yellow]  This may be due to branch protection rules, GitHub Pages, or other repository settings[/yellow]")
-                    else:
-                        self.console.print(f"[red]✗[/red] Failed to make {repo['name']} private: {error_msg}")
-                    error_count += 1
-                
-                except Exception as e:
-                    self.console.print(f"[red]✗[/red] Unexpected error with {repo['name']}: {e}")
-                    error_count += 1
-                    
-        except KeyboardInterrupt:
+        if interrupted:
             self.console.print(f"\n[yellow]Operation interrupted by user[/yellow]")
             self.console.print(f"[green]✓ Successfully made private: {success_count}[/green]")
             if error_count > 0:
@@ -352,10 +383,23 @@ class GitHubPrivacyManager:
         if error_count > 0:
             self.console.print(f"[red]✗ Failed: {error_count}[/red]")
     
-    def run(self, dry_run: bool = True) -> None:
-        """Main method to find and process zero-star public repositories."""
-        # Find candidates
-        repos, forks = self.find_zero_star_public_repos()
+    def run(self, dry_run: bool = True,
+            candidates: Optional[Tuple[List[RepoSummary], List[RepoSummary]]] = None) -> None:
+        """Main method to find and process zero-star public repositories.
+        
+        candidates is a (repos, forks) pair from an earlier
+        find_zero_star_public_repos() call, used instead of scanning again.
+        """
+        # Find candidates; the real run acts on what the preview just showed
+        # instead of scanning again, since GraphQL responses cannot be
+        # revalidated with an ETag
+        if candidates is not None:
+            repos, forks = candidates
+        elif dry_run or self._preview is None:
+            repos, forks = self.find_zero_star_public_repos()
+        else:
+            repos, forks = self._preview
+        self._preview = (repos, forks) if dry_run else None
         
         # Display what was found
         self.display_candidates(repos)
@@ -375,7 +419,8 @@ class GitHubPrivacyManager:
 def main():
     """Main entry point."""
     # Load environment variables
-    load_dotenv()
+    load_env()
+    install_orjson_decoder()
     
     # Get GitHub token
     token = os.getenv('GITHUB_TOKEN')